@@ -1,12 +1,25 @@
-import json
+import logging
 import os
 import re
-from urllib.parse import parse_qs, urlencode, urljoin, urlparse, urlunparse
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import lru_cache
+from urllib.parse import urljoin
 
+import orjson
 import requests
-from bs4 import BeautifulSoup
 from dotenv import load_dotenv  # Optional: for loading credentials from .env
+from requests.adapters import HTTPAdapter
+from selectolax.lexbor import LexborHTMLParser
 from supabase import Client, create_client
+from urllib3.util.retry import Retry
+
+# --- Logging Setup ---
+# Set LOG_LEVEL=WARNING for production runs to skip per-act/per-batch messages.
+logging.basicConfig(
+    level=os.environ.get("LOG_LEVEL", "INFO").upper(),
+    format="%(asctime)s - %(levelname)s - %(message)s",
+)
+log = logging.getLogger(__name__)
 
 # --- Supabase Insertion Function ---
 load_dotenv()
@@ -15,18 +28,74 @@ supabase_url = os.environ.get("SUPABASE_URL")
 supabase_key = os.environ.get("SUPABASE_KEY")
 
 if not supabase_url or not supabase_key:
-    print(
-        "Error: SUPABASE_URL and SUPABASE_KEY must be set in environment variables or .env file"
+    log.error(
+        "SUPABASE_URL and SUPABASE_KEY must be set in environment variables or .env file"
     )
     exit(1)
 
 supabase = create_client(supabase_url, supabase_key)
 
 
+# Columns written to the 'acts' and 'sections' tables
+_ACT_COLS = ("act_name", "act_description", "country", "source", "source_id")
+_ACT_NULLABLE = frozenset({"act_description", "source", "source_id"})
+_SECTION_NULLABLE_COLS = ("questions", "cot_pairs", "additional")
+
+
+def _batch_sections(sections: list):
+    """
+    Yields batches of at most SECTION_BATCH_SIZE sections, cutting a batch
+    early once its text would exceed roughly SECTION_BATCH_MAX_BYTES.
+    """
+    batch = []
+    batch_bytes = 0
+    for section in sections:
+        section_bytes = len(section["section_title"]) + len(section["section_content"])
+        if batch and (
+            len(batch) >= SECTION_BATCH_SIZE
+            or batch_bytes + section_bytes > SECTION_BATCH_MAX_BYTES
+        ):
+            yield batch
+            batch = []
+            batch_bytes = 0
+        batch.append(section)
+        batch_bytes += section_bytes
+    if batch:
+        yield batch
+
+
+def _upsert_sections_batch(batch: list, supabase_client: Client) -> int:
+    """
+    Upserts one batch of sections, skipping titles already stored for the act.
+    Errors raise from execute(). Only the count of newly inserted rows is sent
+    back, not the rows themselves.
+
+    Returns:
+        Number of sections actually inserted.
+    """
+    response = (
+        supabase_client.table("sections")
+        .upsert(
+            batch,
+            on_conflict="act_id,section_title",
+            ignore_duplicates=True,
+            returning="minimal",
+            count="exact",
+        )
+        .execute()
+    )
+    return response.count or 0
+
+
 def store_in_supabase(act_data: dict, all_sections_data: list, supabase_client: Client):
     """
     Inserts the extracted Act and its Sections into Supabase tables.
 
+    The Act is upserted on source_id and Sections are upserted on
+    (act_id, section_title) with duplicates ignored, so re-running an act only
+    adds sections that are not stored yet. Both rely on the unique
+    constraints in migrations/001_acts_sections_unique.sql.
+
     Args:
         act_data: Dictionary containing data for the 'acts' table.
         all_sections_data: List of dictionaries, each containing data for the 'sections' table.
@@ -36,256 +105,174 @@ def store_in_supabase(act_data: dict, all_sections_data: list, supabase_client:
         True if insertion was successful (Act and Sections), False otherwise.
     """
     inserted_act_id = None
-    print("\n--- Starting Supabase Insertion ---")
+    log.info("--- Starting Supabase Insertion ---")
 
-    # Check if act already exists
-    existing_act = get_existing_act(act_data.get("source_id"), supabase_client)
+    # 1. Upsert Act (returns the row whether it was inserted or already existed)
+    try:
+        # Prepare act data: project onto the table's columns, dropping None
+        # values unless the column allows NULL
+        act_to_insert = {}
+        for column in _ACT_COLS:
+            value = act_data.get(column)
+            if value is not None or (column in _ACT_NULLABLE and column in act_data):
+                act_to_insert[column] = value
+        if not act_to_insert.get("act_name") or not act_to_insert.get("country"):
+            log.error("Act name and country are required for insertion.")
+            return False
 
-    if existing_act:
-        inserted_act_id = existing_act["act_id"]
-        print(
-            f"Act already exists with ID: {inserted_act_id}. Will check for new sections."
+        log.info("Attempting to upsert Act: %s", act_to_insert.get("act_name"))
+        act_upsert_response = (
+            supabase_client.table("acts")
+            .upsert(act_to_insert, on_conflict="source_id", ignore_duplicates=False)
+            .execute()
         )
 
-        # Get existing section titles for this act
-        existing_sections = get_existing_sections(inserted_act_id, supabase_client)
-        existing_section_titles = {
-            section["section_title"] for section in existing_sections
-        }
-
-        # Filter out sections that already exist
-        new_sections_data = [
-            section
-            for section in all_sections_data
-            if section.get("section_title") not in existing_section_titles
-        ]
-
-        if not new_sections_data:
-            print("No new sections found for this act.")
-            return True
-
-        print(f"Found {len(new_sections_data)} new sections to insert.")
-        all_sections_data = new_sections_data
-    else:
-        # 1. Insert new Act
-        try:
-            # Prepare act data: Remove None values unless column allows NULL
-            # Assuming 'act_description', 'source', 'source_id' can be NULL based on schema example
-            act_to_insert = {
-                k: v
-                for k, v in act_data.items()
-                if v is not None or k in ["act_description", "source", "source_id"]
-            }
-            if not act_to_insert.get("act_name") or not act_to_insert.get("country"):
-                print("Error: Act name and country are required for insertion.")
-                return False
-
-            print(f"Attempting to insert Act: {act_to_insert.get('act_name')}")
-            act_insert_response = (
-                supabase_client.table("acts").insert(act_to_insert).execute()
-            )
-
-            # Check for errors after executing
-            if hasattr(act_insert_response, "data") and act_insert_response.data:
-                inserted_act_id = act_insert_response.data[0]["act_id"]
-                print(f"Successfully inserted Act, got act_id: {inserted_act_id}")
-            else:
-                # Handle potential API error structure
-                error_message = "Unknown error during Act insertion."
-                if hasattr(act_insert_response, "error") and act_insert_response.error:
-                    error_message = act_insert_response.error.message
-                elif hasattr(act_insert_response, "message"):
-                    error_message = (
-                        act_insert_response.message
-                    )  # Another possible error format
-                print(f"Error inserting Act: {error_message}")
-                # print(f"Full Act Insert Response: {act_insert_response}") # Debugging
-                return False  # Stop if Act insertion fails
+        # Check for errors after executing
+        if hasattr(act_upsert_response, "data") and act_upsert_response.data:
+            inserted_act_id = act_upsert_response.data[0]["act_id"]
+            log.info("Successfully upserted Act, got act_id: %s", inserted_act_id)
+        else:
+            # Handle potential API error structure
+            error_message = "Unknown error during Act upsert."
+            if hasattr(act_upsert_response, "error") and act_upsert_response.error:
+                error_message = act_upsert_response.error.message
+            elif hasattr(act_upsert_response, "message"):
+                error_message = (
+                    act_upsert_response.message
+                )  # Another possible error format
+            log.error("Error upserting Act: %s", error_message)
+            return False  # Stop if Act upsert fails
 
-        except Exception as e:
-            print(f"An exception occurred during Act insertion: {e}")
-            return False
+    except Exception as e:
+        log.error("An exception occurred during Act upsert: %s", e)
+        return False
 
-    # 2. Insert Sections (only if Act was inserted or already exists and sections exist)
+    # 2. Insert Sections (existing titles for this act are skipped by the DB)
     if inserted_act_id and all_sections_data:
-        print(f"\nPreparing {len(all_sections_data)} sections for insertion...")
+        log.info("Preparing %d sections for insertion...", len(all_sections_data))
         sections_to_insert = []
         for section in all_sections_data:
-            # Link section to the inserted Act or existing Act
-            section["act_id"] = inserted_act_id
+            # Make sure required fields like title, content and country are
+            # present before building the row
+            section_title = section.get("section_title")
+            section_content = section.get("section_content")
+            country = section.get("country")
+            if not section_title or not section_content or not country:
+                log.warning(
+                    "Skipping section due to missing required fields: %s",
+                    section_title or "NO TITLE",
+                )
+                continue  # Skip this section if essential data is missing
 
-            # Prepare section data: Remove None values unless column allows NULL
-            # Assuming 'questions', 'cot_pairs', 'additional' can be NULL
-            # Make sure required fields like title, content, act_id, country are present
+            # Link section to the upserted Act; nullable columns are copied as-is
             section_prepared = {
-                k: v
-                for k, v in section.items()
-                if v is not None or k in ["questions", "cot_pairs", "additional"]
+                "section_title": section_title,
+                "section_content": section_content,
+                "act_id": inserted_act_id,
+                "country": country,
             }
-
-            if (
-                not section_prepared.get("section_title")
-                or not section_prepared.get("section_content")
-                or not section_prepared.get("act_id")
-                or not section_prepared.get("country")
-            ):
-                print(
-                    f"Warning: Skipping section due to missing required fields: {section_prepared.get('section_title', 'NO TITLE')}"
-                )
-                continue  # Skip this section if essential data is missing
+            for column in _SECTION_NULLABLE_COLS:
+                if column in section:
+                    section_prepared[column] = section[column]
 
             sections_to_insert.append(section_prepared)
 
         if not sections_to_insert:
-            print("No valid sections prepared for insertion.")
-            # Technically the Act was inserted, so maybe return True? Or False because sections failed?
-            # Let's return True as the Act part was successful.
+            log.info("No valid sections prepared for insertion.")
+            # The Act part was successful, so report success.
             return True
 
         try:
-            print(
-                f"Attempting to insert {len(sections_to_insert)} sections linked to act_id {inserted_act_id}..."
+            log.info(
+                "Attempting to insert %d sections linked to act_id %s...",
+                len(sections_to_insert),
+                inserted_act_id,
             )
-            # Insert sections in batches (adjust batch_size as needed)
-            batch_size = 100  # Supabase often handles ~500-1000 reasonably well, but smaller is safer
-            all_sections_inserted = True
-
-            for i in range(0, len(sections_to_insert), batch_size):
-                batch = sections_to_insert[i : i + batch_size]
-                print(
-                    f"  Inserting batch {i // batch_size + 1} ({len(batch)} sections)..."
-                )
-                sections_insert_response = (
-                    supabase_client.table("sections").insert(batch).execute()
+            batches = list(_batch_sections(sections_to_insert))
+            log.info(
+                "  Inserting %d sections in %d batches...",
+                len(sections_to_insert),
+                len(batches),
+            )
+            # Batches are independent, so a few are sent concurrently.
+            with ThreadPoolExecutor(
+                max_workers=min(SECTION_INSERT_WORKERS, len(batches))
+            ) as executor:
+                inserted_count = sum(
+                    executor.map(
+                        lambda batch: _upsert_sections_batch(batch, supabase_client),
+                        batches,
+                    )
                 )
 
-                # Check batch response
-                if not (
-                    hasattr(sections_insert_response, "data")
-                    and sections_insert_response.data
-                ):
-                    error_message = f"Unknown error during Section batch insertion (Batch {i // batch_size + 1})."
-                    if (
-                        hasattr(sections_insert_response, "error")
-                        and sections_insert_response.error
-                    ):
-                        error_message = sections_insert_response.error.message
-                    elif hasattr(sections_insert_response, "message"):
-                        error_message = sections_insert_response.message
-                    print(f"Error inserting Sections: {error_message}")
-                    # print(f"Full Section Insert Response: {sections_insert_response}") # Debugging
-                    all_sections_inserted = False
-                    break  # Stop inserting further batches on error
-
-            if all_sections_inserted:
-                print(f"Successfully inserted all {len(sections_to_insert)} sections.")
-                return True
-            else:
-                print("Section insertion failed for one or more batches.")
-                return False  # Indicate partial failure
+            log.info(
+                "Inserted %d new sections, %d already existed.",
+                inserted_count,
+                len(sections_to_insert) - inserted_count,
+            )
+            return True
 
         except Exception as e:
-            print(f"An exception occurred during Section insertion: {e}")
+            log.error("An exception occurred during Section insertion: %s", e)
             return False
 
     elif inserted_act_id and not all_sections_data:
-        print(
-            "Act inserted successfully, but no sections were extracted or provided to insert."
+        log.info(
+            "Act upserted successfully, but no sections were extracted or provided to insert."
         )
-        return True  # Act insertion was successful
+        return True  # Act upsert was successful
     else:
-        # This case should theoretically not be reached if act insertion failed
-        print("Act insertion failed, skipping section insertion.")
+        # This case should theoretically not be reached if act upsert failed
+        log.error("Act upsert failed, skipping section insertion.")
         return False
 
 
-def get_existing_act(source_id, supabase_client):
-    """
-    Check if an act already exists in the database by its source_id.
-
-    Args:
-        source_id: The source_id of the act (e.g., "ASA2007")
-        supabase_client: Initialized Supabase client instance
-
-    Returns:
-        Dictionary containing act data if it exists, None otherwise
-    """
-    try:
-        print(f"Checking if act with source_id '{source_id}' already exists...")
-        response = (
-            supabase_client.table("acts")
-            .select("*")
-            .eq("source_id", source_id)
-            .execute()
-        )
-
-        if hasattr(response, "data") and response.data and len(response.data) > 0:
-            return response.data[0]
-        return None
-    except Exception as e:
-        print(f"Error checking for existing act: {e}")
-        return None
-
-
-def get_existing_sections(act_id, supabase_client):
-    """
-    Get all existing sections for an act.
-
-    Args:
-        act_id: The ID of the act
-        supabase_client: Initialized Supabase client instance
-
-    Returns:
-        List of section dictionaries
-    """
-    try:
-        print(f"Fetching existing sections for act_id {act_id}...")
-        response = (
-            supabase_client.table("sections")
-            .select("section_title")
-            .eq("act_id", act_id)
-            .execute()
-        )
-
-        if hasattr(response, "data") and response.data:
-            return response.data
-        return []
-    except Exception as e:
-        print(f"Error fetching existing sections: {e}")
-        return []
-
-
 # --- Configuration ---
 BASE_URL = "https://sso.agc.gov.sg"
 
 
 def generate_act_url(act_path):
     """
-    Generates the initial URL for a specific act with WholeDoc=1 parameter.
+    Generates the initial URL for a specific act. The WholeDoc=1 parameter is
+    passed separately as request params (see WHOLE_DOC_PARAMS).
 
     Args:
         act_path: The path part of the URL for the act (e.g., "/Act/ASA2007")
 
     Returns:
-        Full URL with WholeDoc=1 parameter
+        Full URL for the act
     """
-    initial_act_url_base = urljoin(BASE_URL, act_path)
+    return urljoin(BASE_URL, act_path)
 
-    # Construct URL with ?WholeDoc=1
-    url_parts = list(urlparse(initial_act_url_base))
-    query = parse_qs(url_parts[4])
-    query["WholeDoc"] = "1"
-    url_parts[4] = urlencode(query, doseq=True)
 
-    return urlunparse(url_parts)
+# Query params that make the act page render the whole document
+WHOLE_DOC_PARAMS = {"WholeDoc": 1}
 
 
 # Default act path for testing
 ACT_URL_PATH = "/Act/ASA2007"  # Example path
-INITIAL_ACT_URL = generate_act_url(ACT_URL_PATH)
+INITIAL_ACT_URL = f"{BASE_URL}{ACT_URL_PATH}?WholeDoc=1"
 
 LAZY_LOAD_ENDPOINT = "/Details/GetLazyLoadContent"
 
+# Act browse listing used by get_all_act_paths
+ACT_BROWSE_PAGE_SIZE = 500
+ACT_BROWSE_URL = (
+    f"{BASE_URL}/Browse/Act/Current/All/{{index}}"
+    f"?PageSize={ACT_BROWSE_PAGE_SIZE}&SortBy=Title&SortOrder=ASC"
+)
+ACT_BROWSE_WORKERS = 8
+_RE_ACT_HREF = re.compile(rb'href="(/Act/[^"?\s]+)')
+
+# Number of acts scraped concurrently by scrape_and_store_multiple_acts
+MAX_SCRAPE_WORKERS = 16
+
+# Section upserts: rows per request, approximate payload cap per request,
+# and how many requests store_in_supabase keeps in flight.
+SECTION_BATCH_SIZE = 500
+SECTION_BATCH_MAX_BYTES = 1_000_000
+SECTION_INSERT_WORKERS = 4
+
 # --- Request Headers ---
 headers = {
     "accept": "*/*",
@@ -301,100 +288,178 @@ headers = {
     "x-requested-with": "XMLHttpRequest",
 }
 
+# --- Shared HTTP Session ---
+# One pooled, keep-alive session for every request to sso.agc.gov.sg so each
+# act doesn't pay a fresh TCP+TLS handshake. Retries back off on 429/5xx.
+SESSION = requests.Session()
+SESSION.headers.update(headers)
+_adapter = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=64,
+    max_retries=Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET"],
+    ),
+)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+
 
 # --- Helper Function: Extract Sections from HTML Fragment ---
-# (Remains the same)
-def extract_sections_from_html(html_fragment_content):
-    """Parses an HTML fragment and extracts section data."""
-    sections = []
+_RE_NUM = re.compile(r"^\d+[A-Z]?\.?$")
+_RE_HDR_ID = re.compile(r"pr(\d+[A-Z]?)")
+# "( \n a \n )" list markers split across lines, or runs of 3+ newlines
+_RE_CONTENT_CLEANUP = re.compile(r"\(\s*\n\s*([a-zA-Z0-9]+)\s*\n\s*\)|\n{3,}")
+_RE_SORT = re.compile(r"Section (\d+)([A-Z]?)\.?\s")
+
+
+def _content_cleanup_repl(match):
+    marker = match.group(1)
+    return f"({marker})" if marker is not None else "\n\n"
+
+
+def _parse(html):
+    """
+    Parses act HTML (str or bytes) with the Lexbor backend. An already-parsed
+    tree is returned as-is so callers holding one don't parse the page twice.
+    """
+    if isinstance(html, LexborHTMLParser):
+        return html
+    return LexborHTMLParser(html)
+
+
+def _get_text(node, separator=""):
+    """
+    Equivalent of BeautifulSoup's get_text(separator=..., strip=True).
+
+    Lexbor keeps whitespace-only text nodes as empty strings when stripping,
+    so drop them before joining to avoid stray blank lines.
+    """
+    if separator == "":
+        return node.text(deep=True, strip=True)
+    parts = node.text(deep=True, separator="\x00", strip=True).split("\x00")
+    return separator.join(part for part in parts if part)
+
+
+def iter_sections_from_html(html_fragment_content):
+    """
+    Parses an HTML fragment (str or bytes, or an already-parsed tree, which is
+    modified in place) and yields section data one section at a time, so callers that
+    don't need the whole act at once can consume it lazily.
+    """
     if not html_fragment_content:
-        return sections
+        return
 
-    soup_full_content = BeautifulSoup(html_fragment_content, "html.parser")
+    tree = _parse(html_fragment_content)
 
     # remove all divs with class_='amendNote'
-    for amendNote in soup_full_content.find_all(class_="amendNote"):
-        amendNote.decompose()
+    for amend_note in tree.css(".amendNote"):
+        amend_note.decompose()
 
-    sections_container = soup_full_content.find("div", class_="body")
+    sections_container = tree.css_first("div.body")
     if not sections_container:
-        print(
-            "Warning: Could not find the main 'div.body' container in the fetched content."
+        log.warning(
+            "Could not find the main 'div.body' container in the fetched content."
         )
-        sections_container = soup_full_content  # Fallback
+        sections_container = tree.root  # Fallback
 
-    section_divs = sections_container.find_all("div", class_="prov1")
+    section_divs = sections_container.css("div.prov1")
     if not section_divs:
-        print(
-            "Warning: No 'div.prov1' elements (sections) found within the content container."
+        log.warning(
+            "No 'div.prov1' elements (sections) found within the content container."
         )
-        return sections
+        return
 
     for section_div in section_divs:
         section = {}
         additional_info = {}
-        header_tag = section_div.find("td", class_="prov1Hdr")
-        title_text_only = (
-            header_tag.get_text(strip=True) if header_tag else "Unknown Title"
-        )
-        content_tag = section_div.find("td", class_="prov1Txt")
+        header_tag = section_div.css_first("td.prov1Hdr")
+        header_id = header_tag.attributes.get("id") if header_tag else None
+        title_text_only = _get_text(header_tag) if header_tag else "Unknown Title"
+        content_tag = section_div.css_first("td.prov1Txt")
 
         if content_tag:
-            number_tag = content_tag.find("strong")
+            number_tag = content_tag.css_first("strong")
             section_number_text = ""
             full_title = title_text_only
 
             if number_tag:
-                potential_number = number_tag.get_text(strip=True)
-                if re.match(r"^\d+[A-Z]?\.?$", potential_number):
+                potential_number = _get_text(number_tag)
+                if _RE_NUM.match(potential_number):
                     section_number_text = potential_number
                     full_title = f"Section {section_number_text} {title_text_only}"
 
-            if not section_number_text and header_tag and header_tag.get("id"):
-                header_id = header_tag.get("id")
-                match = re.match(r"pr(\d+[A-Z]?)", header_id)
+            if not section_number_text and header_id:
+                match = _RE_HDR_ID.match(header_id)
                 if match:
                     section_number_text = match.group(1) + "."
                     full_title = f"Section {section_number_text} {title_text_only}"
 
             section["section_title"] = full_title
 
-            section_content_raw = content_tag.get_text(separator="\n", strip=True)
-            processed_content = re.sub(
-                r"\(\s*\n\s*([a-zA-Z0-9]+)\s*\n\s*\)", r"(\1)", section_content_raw
-            )
-            processed_content = re.sub(r"\n{3,}", r"\n\n", processed_content)
-            if section_number_text:
-                escaped_num = re.escape(section_number_text)
-                processed_content = re.sub(
-                    r"^" + escaped_num + r"\n",
-                    escaped_num + " ",
-                    processed_content,
-                    count=1,
+            section_content_raw = _get_text(content_tag, separator="\n")
+            # Join a leading "12.\n" onto the first line, then clean up the
+            # rest of the text in a single regex pass.
+            if section_number_text and section_content_raw.startswith(
+                section_number_text + "\n"
+            ):
+                section_content_raw = (
+                    section_number_text
+                    + " "
+                    + section_content_raw[len(section_number_text) + 1 :]
                 )
+            processed_content = _RE_CONTENT_CLEANUP.sub(
+                _content_cleanup_repl, section_content_raw
+            )
             section["section_content"] = processed_content.strip()
 
             section["act_id"] = None
             section["country"] = "SINGAPORE"
             section["questions"] = None
             section["cot_pairs"] = None
-            additional_info["header_id"] = header_tag.get("id") if header_tag else None
-            section["additional"] = json.dumps(additional_info)
-            sections.append(section)
+            additional_info["header_id"] = header_id
+            section["additional"] = additional_info
+            yield section
         else:
-            print(
-                f"Warning: Could not find content tag 'prov1Txt' for section starting with header: {title_text_only}"
+            log.warning(
+                "Could not find content tag 'prov1Txt' for section starting with header: %s",
+                title_text_only,
             )
-    return sections
+
+
+def extract_sections_from_html(html_fragment_content):
+    """Parses an HTML fragment and extracts section data."""
+    return list(iter_sections_from_html(html_fragment_content))
+
+
+@lru_cache(maxsize=256)
+def _parse_toc_config(data_json_str):
+    """
+    Decodes a global-vars data-json blob and returns (tocSysId, fragments),
+    or None if it isn't the TOC config. Cached on the raw string so re-scraping
+    the same act skips the JSON decode. Callers must not mutate the result.
+    """
+    try:
+        config_data = orjson.loads(data_json_str)
+    except orjson.JSONDecodeError as e:
+        log.warning("Could not parse JSON from global-vars: %s", e)
+        return None
+    # Check for tocSysId and the fragments dictionary
+    if "tocSysId" in config_data and "fragments" in config_data:
+        return config_data.get("tocSysId"), config_data.get("fragments")
+    return None
 
 
 # --- Main Scraping Logic ---
-def scrape_act(act_path=ACT_URL_PATH):
+def scrape_act(act_path=ACT_URL_PATH, session=SESSION):
     """
     Scrape an act from Singapore Statutes Online using the provided act path.
 
     Args:
         act_path: The path part of the URL for the act (e.g., "/Act/ASA2007")
+        session: requests Session to fetch with (defaults to the shared pool)
 
     Returns:
         Tuple of (act_data, all_sections_data)
@@ -407,49 +472,34 @@ def scrape_act(act_path=ACT_URL_PATH):
     try:
         # 1. Generate Initial URL and make request
         initial_act_url = generate_act_url(act_path)
-        print(f"Fetching initial page: {initial_act_url}")
-        session = requests.Session()
-        session.headers.update(headers)
-        response_initial = session.get(initial_act_url)
+        log.info("Fetching initial page: %s", initial_act_url)
+        response_initial = session.get(initial_act_url, params=WHOLE_DOC_PARAMS)
         response_initial.raise_for_status()
-        soup_initial = BeautifulSoup(response_initial.content, "html.parser")
+        tree_initial = _parse(response_initial.content)
 
         # 2. Extract Initial Metadata
-        act_title_tag = soup_initial.find("td", class_="actHd")
-        long_title_tag = soup_initial.find("td", class_="longTitle")
+        act_title_tag = tree_initial.css_first("td.actHd")
+        long_title_tag = tree_initial.css_first("td.longTitle")
         act_data["act_name"] = (
-            act_title_tag.get_text(strip=True)
-            if act_title_tag
-            else f"UNKNOWN ACT ({act_path})"
+            _get_text(act_title_tag) if act_title_tag else f"UNKNOWN ACT ({act_path})"
         )
         act_data["act_description"] = (
-            long_title_tag.get_text(separator=" ", strip=True) if long_title_tag else ""
+            _get_text(long_title_tag, separator=" ") if long_title_tag else ""
         )
         act_data["country"] = "SINGAPORE"
         act_data["source"] = "Singapore Statutes Online (sso.agc.gov.sg)"
         act_data["source_id"] = act_path.split("/")[-1]
 
         # Extract tocSysId and the first key from fragments dictionary
-        global_vars_divs = soup_initial.find_all("div", class_="global-vars")
-        config_data = None
+        # Only the global-vars div carrying tocSysId is consumed, so let the
+        # selector engine skip the others instead of JSON-decoding each one.
+        global_vars_divs = tree_initial.css('div.global-vars[data-json*="tocSysId"]')
         fragments_dict = None
         for div in global_vars_divs:
-            data_json_str = div.get("data-json")
-            if data_json_str:
-                try:
-                    potential_config = json.loads(data_json_str)
-                    # Check for tocSysId and the fragments dictionary
-                    if (
-                        "tocSysId" in potential_config
-                        and "fragments" in potential_config
-                    ):
-                        config_data = potential_config
-                        toc_sys_id = config_data.get("tocSysId")
-                        fragments_dict = config_data.get("fragments")
-                        break  # Found the necessary config
-                except json.JSONDecodeError as e:
-                    print(f"Warning: Could not parse JSON from global-vars: {e}")
-                    continue
+            toc_config = _parse_toc_config(div.attributes.get("data-json"))
+            if toc_config:
+                toc_sys_id, fragments_dict = toc_config
+                break  # Found the necessary config
 
         if not toc_sys_id:
             raise ValueError("Could not extract tocSysId from configuration JSON.")
@@ -475,39 +525,37 @@ def scrape_act(act_path=ACT_URL_PATH):
                 "Failed to extract the first fragment key to use as SeriesId."
             )
 
-        print(f"Found TocSysId: {toc_sys_id}")
-        print(
-            f"Using first fragment key as SeriesId for full content: {series_id_for_full_content}"
+        log.info("Found TocSysId: %s", toc_sys_id)
+        log.info(
+            "Using first fragment key as SeriesId for full content: %s",
+            series_id_for_full_content,
         )
 
-        print("\n--- Extracted Act Data ---")
-        print(json.dumps(act_data, indent=2))
+        log.info("--- Extracted Act Data --- %s", act_data)
 
         # 3. Fetch Full Content Fragment
-        print("\n--- Fetching Full Content Fragment ---")
         lazy_load_url = urljoin(BASE_URL, LAZY_LOAD_ENDPOINT)
         params = {
             "TocSysId": toc_sys_id,
             "SeriesId": series_id_for_full_content,  # Use the extracted first key
         }
-        print(
-            f"Fetching full content fragment (SeriesId: {series_id_for_full_content})..."
+        log.info(
+            "Fetching full content fragment (SeriesId: %s)...",
+            series_id_for_full_content,
         )
 
         response_full_content = session.get(lazy_load_url, params=params)
         response_full_content.raise_for_status()
 
-        # 4. Extract Sections from the Full Fragment
-        full_html = response_full_content.text
-        all_sections_data = extract_sections_from_html(full_html)
+        # 4. Extract Sections from the Full Fragment (raw bytes; Lexbor
+        # handles the decoding, avoiding requests' charset detection)
+        all_sections_data = extract_sections_from_html(response_full_content.content)
 
-        print(f"\n--- Total Sections Extracted: {len(all_sections_data)} ---")
+        log.info("--- Total Sections Extracted: %d ---", len(all_sections_data))
         if all_sections_data:
             # Sorting logic (remains useful)
             def sort_key(section):
-                match = re.search(
-                    r"Section (\d+)([A-Z]?)\.?\s", section.get("section_title", "")
-                )
+                match = _RE_SORT.search(section.get("section_title", ""))
                 if match:
                     num_part = int(match.group(1))
                     alpha_part = match.group(2)
@@ -517,104 +565,163 @@ def scrape_act(act_path=ACT_URL_PATH):
 
             all_sections_data.sort(key=sort_key)
 
-            print("First extracted section:")
-            print(json.dumps(all_sections_data[0], indent=2))
+            log.debug("First extracted section: %s", all_sections_data[0])
         else:
-            print(
+            log.warning(
                 "No sections were successfully extracted from the full content fragment."
             )
 
         return act_data, all_sections_data
 
     except requests.exceptions.RequestException as e:
-        print(f"Error during network request: {e}")
+        log.error("Error during network request: %s", e)
     except ValueError as e:
-        print(f"Configuration error: {e}")
+        log.error("Configuration error: %s", e)
     except Exception as e:
-        print(f"An unexpected error occurred: {e}")
+        log.error("An unexpected error occurred: %s", e)
 
     return None, None
 
 
-def scrape_and_store_multiple_acts(act_paths):
+def scrape_and_store_multiple_acts(act_paths, max_workers=MAX_SCRAPE_WORKERS):
     """
     Scrape and store multiple acts based on the provided list of act paths.
 
+    Scraping (network + parsing) runs on a thread pool; storing in Supabase
+    stays on the calling thread so writes happen one act at a time.
+
     Args:
         act_paths: List of act paths to scrape (e.g. ["/Act/ASA2007", "/Act/ANOTHER_ACT"])
+        max_workers: Number of acts to scrape concurrently
 
     Returns:
         Dictionary of results with act paths as keys and success status as values
     """
-    results = {}
-    total_acts = len(act_paths)
-
-    print(f"\n=== Starting batch scraping of {total_acts} acts ===\n")
-
-    for index, act_path in enumerate(act_paths, 1):
-        print(f"\n[{index}/{total_acts}] Processing act: {act_path}")
-
-        try:
-            # 1. Scrape the act
-            act_data, all_sections_data = scrape_act(act_path)
-
-            # 2. If data was retrieved successfully, store it in Supabase
-            if act_data and all_sections_data:
-                print(
-                    f"Successfully scraped act '{act_data.get('act_name')}' with {len(all_sections_data)} sections"
+    # Repeated paths are scraped and stored once (order of first occurrence kept)
+    results = dict.fromkeys(act_paths, False)
+    total_acts = len(results)
+    completed = 0
+
+    log.info("=== Starting batch scraping of %d acts ===", total_acts)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        paths_iter = iter(list(results))
+        pending = {}
+
+        def submit_next():
+            act_path = next(paths_iter, None)
+            if act_path is not None:
+                pending[executor.submit(scrape_act, act_path)] = act_path
+
+        # Keep a bounded number of scraped acts in flight so memory stays flat
+        # even when Supabase writes fall behind the scrapers.
+        for _ in range(max_workers * 2):
+            submit_next()
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                act_path = pending.pop(future)
+                completed += 1
+                log.info(
+                    "[%d/%d] Processing act: %s", completed, total_acts, act_path
                 )
-                print("Storing in Supabase...")
 
-                success = store_in_supabase(act_data, all_sections_data, supabase)
-
-                if success:
-                    print(
-                        f"Successfully stored act '{act_data.get('act_name')}' in Supabase"
-                    )
-                    results[act_path] = True
-                else:
-                    print(
-                        f"Failed to store act '{act_data.get('act_name')}' in Supabase"
-                    )
+                try:
+                    # 1. Collect the scraped act
+                    act_data, all_sections_data = future.result()
+
+                    # 2. If data was retrieved successfully, store it in Supabase
+                    if act_data and all_sections_data:
+                        log.info(
+                            "Successfully scraped act '%s' with %d sections",
+                            act_data.get("act_name"),
+                            len(all_sections_data),
+                        )
+                        log.info("Storing in Supabase...")
+
+                        success = store_in_supabase(
+                            act_data, all_sections_data, supabase
+                        )
+
+                        if success:
+                            log.info(
+                                "Successfully stored act '%s' in Supabase",
+                                act_data.get("act_name"),
+                            )
+                            results[act_path] = True
+                        else:
+                            log.error(
+                                "Failed to store act '%s' in Supabase",
+                                act_data.get("act_name"),
+                            )
+                            results[act_path] = False
+                    else:
+                        log.error("Failed to scrape act: %s", act_path)
+                        results[act_path] = False
+
+                except Exception as e:
+                    log.error("Error processing act %s: %s", act_path, e)
                     results[act_path] = False
-            else:
-                print(f"Failed to scrape act: {act_path}")
-                results[act_path] = False
 
-        except Exception as e:
-            print(f"Error processing act {act_path}: {str(e)}")
-            results[act_path] = False
-
-        # Add a separator between acts for better readability in logs
-        print(f"\n{'='*50}\n")
+                submit_next()
 
     # Summary report
     successful = sum(1 for success in results.values() if success)
-    print(f"\n=== Batch scraping completed ===")
-    print(f"Successfully processed {successful}/{total_acts} acts")
+    log.info("=== Batch scraping completed ===")
+    log.info("Successfully processed %d/%d acts", successful, total_acts)
 
     return results
 
 
-def get_all_act_paths():
-    index = 0
-    act_paths = set()  # Using a set to automatically remove duplicates
-    while True:
-        response = requests.get(
-            f"https://sso.agc.gov.sg/Browse/Act/Current/All/{index}?PageSize=500&SortBy=Title&SortOrder=ASC",
-            headers=headers,
+def _fetch_act_browse_page(index, session):
+    """
+    Fetches one page of the Act browse listing. Links are harvested with a
+    regex over the raw bytes, so no DOM is built for these pages.
+
+    Returns:
+        Tuple of (set of act paths on the page, number of act links on the page)
+
+    Raises:
+        requests.HTTPError: If the page is not served with status 200, so an
+            error page is never mistaken for a short last page
+    """
+    response = session.get(ACT_BROWSE_URL.format(index=index))
+    if response.status_code != 200:
+        raise requests.HTTPError(
+            f"Act browse page {index} returned status {response.status_code}",
+            response=response,
         )
-        soup = BeautifulSoup(response.text, "html.parser")
-        for link in soup.find_all("a", href=True):
-            href = link["href"]
-            if href.startswith("/Act/"):
-                # Only keep clean URLs without query parameters
-                base_url = href.split("?")[0]
-                act_paths.add(base_url)
-        if len(soup.find_all("a", href=True)) < 500:
-            break
-        index += 1
-    return list(act_paths)  # Convert set back to list
+    # Paths are captured without query parameters
+    hrefs = _RE_ACT_HREF.findall(response.content)
+    return {href.decode() for href in hrefs}, len(hrefs)
+
+
+def get_all_act_paths(session=SESSION, max_workers=ACT_BROWSE_WORKERS):
+    """
+    Collects every Act path from the paginated browse listing.
+
+    Pages are index-addressable, so they are fetched speculatively in
+    parallel rounds (doubling in size up to max_workers). The first page with
+    fewer than ACT_BROWSE_PAGE_SIZE act links marks the end of the listing;
+    pages past it are ignored. A page that fails to load raises instead of
+    ending the listing early.
+    """
+    act_paths = set()  # Using a set to automatically remove duplicates
+    index = 0
+    round_size = 2
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while True:
+            pages = executor.map(
+                lambda page_index: _fetch_act_browse_page(page_index, session),
+                range(index, index + round_size),
+            )
+            for page_paths, link_count in pages:
+                act_paths.update(page_paths)
+                if link_count < ACT_BROWSE_PAGE_SIZE:
+                    return list(act_paths)  # Convert set back to list
+            index += round_size
+            round_size = min(round_size * 2, max_workers)
 
 
 # Example usage
@@ -626,9 +733,9 @@ if __name__ == "__main__":
 
     # scrape_and_store_multiple_acts(act_paths_to_scrape)
 
-    response = requests.get(BASE_URL + "/SL/AA2004-R5", headers=headers)
-    soup = BeautifulSoup(response.text, "html.parser")
-    print(soup.prettify())
+    response = SESSION.get(BASE_URL + "/SL/AA2004-R5")
+    tree = _parse(response.content)
+    print(tree.html)
 
-    sections = extract_sections_from_html(response.text)
-    print(json.dumps(sections, indent=2))
+    sections = extract_sections_from_html(tree)
+    print(orjson.dumps(sections, option=orjson.OPT_INDENT_2).decode())
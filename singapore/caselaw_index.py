@@ -3,10 +3,16 @@ import json
 import os
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from urllib.parse import quote
 
+import orjson
 import requests
 from dotenv import load_dotenv
-from utils.cron_tracker import complete_job, fail_job, start_job
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from utils.cron_tracker import track_job
 
 from supabase import create_client
 
@@ -25,154 +31,294 @@ CONFIG = {
     "maxEntriesPerPage": 10,  # Maximum number of entries to process per page
     "filterBatchSize": 10000,  # Size of batches for filtering URLs
     "requestInterval": 1,  # Delay in seconds between pages
+    "maxConcurrentRequests": 8,  # Cases scraped in parallel on each page
 }
 
 
+# Shared HTTP session: keeps connections to the Cloudflare worker alive
+# across requests and retries failed responses with backoff
+SESSION = requests.Session()
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET"],
+            raise_on_status=False,  # Return the last response instead of raising
+        ),
+    ),
+)
+
+
+def select_columns(table, columns, **kwargs):
+    """
+    Start a select on a table that names its columns explicitly
+
+    Args:
+        table: The table to read
+        columns: Comma-separated column names; "*" is rejected so queries
+            never pull whole rows by accident
+        **kwargs: Passed through to select (e.g. count, head)
+    Returns:
+        The query builder
+    """
+    if "*" in columns:
+        raise ValueError(f"Select explicit columns from {table}, not '*'")
+    return supabase.table(table).select(columns, **kwargs)
+
+
 def sleep(seconds):
     """Simple sleep function"""
     time.sleep(seconds)
 
 
-def fetch_with_retry(url, retries=5, delay_sec=2):
-    """Fetch a URL with retry logic"""
-    for i in range(retries):
-        response = requests.get(url)
-        if response.ok:
-            return response
-        elif i < retries - 1:
-            sleep(delay_sec)
+def fetch_with_retry(url):
+    """Fetch a URL; retries with backoff are handled by SESSION's adapter"""
+    response = SESSION.get(url)
+    if response.ok:
+        return response
 
-    return {"url": url, "status": "error", "error": "Failed after multiple retries"}
+    return {
+        "url": url,
+        "status": "error",
+        "error": f"Failed after multiple retries (status {response.status_code})",
+    }
 
 
-def check_if_citation_exists(citation):
+def build_case_row(case_data):
     """
-    Check if a case with the given citation already exists in the database
+    Build the caselaw_singapore row for a scraped case
 
     Args:
-        citation: The citation to check
+        case_data: The scraped case data
     Returns:
-        True if the citation exists, False otherwise
+        Tuple of (row, outcome). row is None if the case has no text or is
+        not from a binding court, and outcome holds the processed, status and
+        error_message to record for it. Empty text can be a transient worker
+        failure, so it is recorded as an unprocessed error and retried; a
+        non-binding court is recorded as processed with status "skipped"
     """
-    if not citation:
-        return False
-
-    try:
-        response = (
-            supabase.table("caselaw_singapore")
-            .select("id")
-            .eq("citation", citation)
-            .execute()
-        )
-
-        return bool(response.data)
-    except Exception as e:
-        print(f"Error checking citation status: {e}")
-        return False
-
-
-def insert_case_law(case_data, source_url):
+    if not case_data.get("case_text") or len(case_data["case_text"].strip()) == 0:
+        print(f"Skipping case with empty text: {case_data.get('case_name')}")
+        return None, {
+            "processed": False,
+            "status": "error",
+            "error_message": "Empty case text",
+        }
+
+    standard_court_name = standardize_court_name(case_data.get("court_name"))
+    if standard_court_name is None:
+        print(f"Skipping case from non-binding court: {case_data.get('case_name')}")
+        return None, {
+            "processed": True,
+            "status": "skipped",
+            "error_message": f"Non-binding court: {case_data.get('court_name')}",
+        }
+
+    return {
+        "standard_court_name": standard_court_name,
+        "case_name": case_data.get("case_name"),
+        "case_no": case_data.get("case_no"),
+        "date": case_data.get("date"),
+        "case_text": case_data.get("case_text"),
+        "citation": case_data.get("citation"),
+        "country": "Singapore",
+    }, None
+
+
+def insert_case_laws(cases, processing_date):
     """
-    Insert Singapore case law data into the caselaw_singapore table
+    Insert a page of Singapore case law data into the caselaw_singapore table
+    with a single upsert_caselaw_singapore call, which skips cases whose
+    citation already exists
 
     Args:
-        case_data: The case data to insert
-        source_url: The URL from which the case was scraped
+        cases: The scraped case data, each with the "url" it was scraped from
+        processing_date: Timestamp recorded on the tracking rows
     Returns:
-        The ID of the case record
+        Tuple of (inserted, tracking_rows). inserted maps each inserted
+        case's source URL to its case ID, leaving out cases skipped as
+        duplicates, and is empty if the insert failed. tracking_rows are the
+        caselaw_scraping_urls rows recording the outcome for each URL (see
+        record_processed_urls). Cases dropped by build_case_row are recorded
+        with the outcome it gives
     """
-    try:
-        # Check if the citation already exists
-        if case_data.get("citation"):
-            citation_exists = check_if_citation_exists(case_data["citation"])
-            if citation_exists:
-                print(f"Skipping case with existing citation: {case_data['citation']}")
-                return None
-
-        # Standardize court name
-        standardized_court = standardize_court_name(case_data.get("court_name"))
-
-        if not case_data.get("case_text") or len(case_data["case_text"].strip()) == 0:
-            print(f"Skipping case with empty text: {case_data['case_name']}")
-            return None
-
-        # Insert the case data with standardized court name
-        response = (
-            supabase.table("caselaw_singapore")
-            .insert(
+    rows = []
+    source_urls = []
+    skipped_rows = []
+    for case_data in cases:
+        row, outcome = build_case_row(case_data)
+        if row:
+            rows.append(row)
+            source_urls.append(case_data["url"])
+        else:
+            skipped_rows.append(
                 {
-                    "standard_court_name": standardized_court,
-                    "case_name": case_data.get("case_name"),
-                    "case_no": case_data.get("case_no"),
-                    "date": case_data.get("date"),
-                    "case_text": case_data.get("case_text"),
-                    "citation": case_data.get("citation"),
+                    "url": case_data["url"],
+                    "case_id": None,
+                    "processing_date": processing_date,
                     "country": "Singapore",
+                    **outcome,
                 }
             )
-            .execute()
-        )
-        if not response.data:
-            raise Exception("No data returned from insert operation")
 
-        case_id = response.data[0]["id"]
-        print(f"Inserted case: {case_data['case_name']} (ID: {case_id})")
+    if not rows:
+        return {}, skipped_rows
 
-        # Record that this URL has been processed
-        supabase.table("caselaw_scraping_urls").upsert(
+    try:
+        response = supabase.rpc("upsert_caselaw_singapore", {"rows": rows}).execute()
+
+        # row_index is the 1-based position of the inserted case in rows
+        inserted = {}
+        for row in response.data:
+            inserted[source_urls[row["row_index"] - 1]] = row["case_id"]
+            print(f"Inserted case: {row['case_name']} (ID: {row['case_id']})")
+
+        skipped = len(rows) - len(inserted)
+        if skipped:
+            print(f"Skipped {skipped} cases with existing citations")
+
+        # Record that these URLs have been processed
+        tracking_rows = [
             {
                 "url": source_url,
                 "case_id": case_id,
                 "processed": True,
-                "processing_date": str(time.strftime("%Y-%m-%d %H:%M:%S")),
+                "processing_date": processing_date,
                 "status": "success",
+                "error_message": None,
                 "country": "Singapore",
-            },
-            on_conflict="url",
-        ).execute()
+            }
+            for source_url, case_id in inserted.items()
+        ]
 
-        return case_id
+        return inserted, tracking_rows + skipped_rows
 
     except Exception as e:
-        # Record the error for this URL
-        supabase.table("caselaw_scraping_urls").upsert(
+        print(f"Error inserting Singapore case law: {e}")
+
+        # Record the error for every URL in the failed insert
+        return {}, [
             {
                 "url": source_url,
+                "case_id": None,
                 "processed": False,
-                "processing_date": str(time.strftime("%Y-%m-%d %H:%M:%S")),
+                "processing_date": processing_date,
                 "status": "error",
                 "error_message": str(e),
                 "country": "Singapore",
-            },
-            on_conflict="url",
-        ).execute()
+            }
+            for source_url in source_urls
+        ] + skipped_rows
 
-        print(f"Error inserting Singapore case law: {e}")
-        raise e
+
+def record_processed_urls(tracking_rows):
+    """
+    Record the outcome of a page of URLs in caselaw_scraping_urls with a
+    single upsert. PostgREST needs every row of a bulk upsert to have the
+    same keys, so insert_case_laws gives all its rows the same columns
+
+    Args:
+        tracking_rows: The rows collected by insert_case_laws
+    """
+    if not tracking_rows:
+        return
+
+    try:
+        supabase.table("caselaw_scraping_urls").upsert(
+            tracking_rows, on_conflict="url"
+        ).execute()
+    except Exception as e:
+        print(f"Error recording URL status: {e}")
 
 
-def check_if_url_processed(url):
+def fetch_url_statuses(urls):
     """
-    Check if a URL has been processed
+    Find which of the given URLs have already been recorded, using one
+    IN query per CONFIG["filterBatchSize"] URLs instead of one query per URL
 
     Args:
-        url: The URL to check
+        urls: The URLs to check
     Returns:
-        True if the URL has been processed, False otherwise
+        Dict mapping each recorded URL to its processed flag; URLs that
+        have never been recorded are left out
     """
+    url_statuses = {}
+    batch_size = CONFIG["filterBatchSize"]
     try:
-        response = (
-            supabase.table("caselaw_scraping_urls")
-            .select("processed")
-            .eq("url", url)
-            .eq("processed", True)
-            .execute()
-        )
-
-        return bool(response.data)
+        for i in range(0, len(urls), batch_size):
+            response = (
+                select_columns("caselaw_scraping_urls", "url, processed")
+                .in_("url", urls[i : i + batch_size])
+                .execute()
+            )
+            url_statuses.update(
+                (row["url"], row["processed"]) for row in response.data
+            )
     except Exception as e:
         print(f"Error checking URL status: {e}")
-        return False
+
+    return url_statuses
+
+
+def fetch_case(url):
+    """
+    Scrape a single case through the Cloudflare worker, retrying with
+    isOld=true if the first attempt returns blank case_text
+
+    Args:
+        url: The eLitigation path of the case
+    Returns:
+        The case data with its "url", or an error dict
+    """
+    try:
+        # First try without isOld parameter
+        full_url = f"{CLOUDFLARE_URL}/scrape/cases?url={quote(f'https://www.elitigation.sg{url}')}"
+        print(f"First attempt: {full_url}")
+
+        response = fetch_with_retry(full_url)
+
+        if isinstance(response, requests.Response) and response.ok:
+            data = orjson.loads(response.content)
+
+            # If case_text is blank, try again with isOld=true
+            if not data.get("case_text") or len(data.get("case_text", "").strip()) == 0:
+                print(f"Blank case_text found, retrying with isOld=true for: {url}")
+                full_url = f"{full_url}&isOld=true"
+                print(f"Second attempt: {full_url}")
+
+                response = fetch_with_retry(full_url)
+                if isinstance(response, requests.Response) and response.ok:
+                    data = orjson.loads(response.content)
+
+            data["url"] = url
+            return data
+        else:
+            error_msg = (
+                response.get("error")
+                if isinstance(response, dict)
+                else f"HTTP error! Status: {response.status_code}"
+            )
+            return {"url": url, "status": "error", "error": error_msg}
+    except Exception as e:
+        return {"url": url, "status": "error", "error": str(e)}
+
+
+def fetch_sitemap_page(page_index):
+    """
+    Fetch one page of the case sitemap through the Cloudflare worker
+
+    Args:
+        page_index: The 1-based sitemap page
+    Returns:
+        The response for the page
+    """
+    url = f"{CLOUDFLARE_URL}/sitemap/cases?index={page_index}"
+    print(url)
+    return SESSION.get(url)
 
 
 def scrape_singapore_case_laws(max_pages=None):
@@ -186,173 +332,130 @@ def scrape_singapore_case_laws(max_pages=None):
     new_cases_found = 0
     page_index = 1  # Start from page 1 for new cases
     pages_processed_count = 0  # Renamed from page_index to avoid confusion
-    job_run_id = None
 
-    try:
-        # Start job tracking
-        job_run_id, success = start_job(supabase, job_name)
-        if not success:
-            print("Warning: Failed to start job tracking. Continuing without tracking.")
-
-        has_more_pages = True
-        consecutive_pages_with_no_new_cases = 0
-
-        # Use provided max_pages if specified, otherwise use CONFIG
-        max_pages_to_process = max_pages or CONFIG["maxPages"]  # Renamed from max_pages
-
-        # Process pages until no more results or safety limit reached
-        while (
-            has_more_pages and page_index <= max_pages_to_process
-        ):  # Use renamed max_pages_to_process
-            current_page_processed = False
-            print(f"Processing page {page_index}...")
-
-            # Get list of case URLs for current page
-            url = f"{CLOUDFLARE_URL}/sitemap/cases?index={page_index}"
-            print(url)
-
-            cases_response = requests.get(url)
-            if not cases_response.ok:
-                print(
-                    f"Failed to fetch cases for page {page_index}: {cases_response.status_code}"
+    # The run is recorded with one insert when it ends (see track_job)
+    with track_job(supabase, job_name) as metrics:
+        try:
+            has_more_pages = True
+            consecutive_pages_with_no_new_cases = 0
+
+            # Use provided max_pages if specified, otherwise use CONFIG
+            max_pages_to_process = max_pages or CONFIG["maxPages"]  # Renamed from max_pages
+
+            # Fetch all sitemap pages up front in parallel; they are processed in
+            # order below, so the early-stop rules are unchanged
+            with ThreadPoolExecutor(
+                max_workers=CONFIG["maxConcurrentRequests"]
+            ) as executor:
+                sitemap_responses = list(
+                    executor.map(fetch_sitemap_page, range(1, max_pages_to_process + 1))
                 )
-                has_more_pages = False
-                pages_processed_count = page_index - 1  # Record actual pages attempted
-                break
-
-            case_urls = cases_response.json()
-            if not case_urls or not len(case_urls):
-                print(f"No cases found on page {page_index}, stopping pagination")
-                has_more_pages = False
-                pages_processed_count = page_index - 1  # Record actual pages attempted
-                break
-
-            print(f"Found {len(case_urls)} cases on page {page_index}")
-            current_page_processed = True
-
-            # Limit the number of cases processed per page if needed
-            cases_to_process = case_urls[: CONFIG["maxEntriesPerPage"]]
-
-            # Check which URLs have already been processed
-            urls_to_process = []
-            for url in cases_to_process:
-                is_processed = check_if_url_processed(url)
-                if not is_processed:
-                    urls_to_process.append(url)
-
-            print(f"{len(urls_to_process)} cases need processing on page {page_index}")
-
-            # If no new cases on this page, increment the counter
-            if not urls_to_process:
-                consecutive_pages_with_no_new_cases += 1
-                # If we've seen 3 consecutive pages with no new cases, assume we've caught up
-                if consecutive_pages_with_no_new_cases >= 3:
-                    print("Found 3 consecutive pages with no new cases. Stopping.")
+
+            # Process pages until no more results or safety limit reached
+            while (
+                has_more_pages and page_index <= max_pages_to_process
+            ):  # Use renamed max_pages_to_process
+                current_page_processed = False
+                print(f"Processing page {page_index}...")
+
+                # Get list of case URLs for current page
+                cases_response = sitemap_responses[page_index - 1]
+                if not cases_response.ok:
+                    print(
+                        f"Failed to fetch cases for page {page_index}: {cases_response.status_code}"
+                    )
+                    has_more_pages = False
+                    pages_processed_count = page_index - 1  # Record actual pages attempted
                     break
-                # Continue to next page
-                page_index += 1
-                pages_processed_count = page_index - 1  # Update before sleep/continue
-                sleep(CONFIG["requestInterval"])
-                continue
-            else:
-                # Reset the counter if we found new cases
-                consecutive_pages_with_no_new_cases = 0
-
-            # Process each URL
-            results = []
-            for url in urls_to_process:
-                try:
-                    # First try without isOld parameter
-                    full_url = f"{CLOUDFLARE_URL}/scrape/cases?url={requests.utils.quote(f'https://www.elitigation.sg{url}')}"
-                    print(f"First attempt: {full_url}")
-
-                    response = fetch_with_retry(full_url)
-
-                    if isinstance(response, requests.Response) and response.ok:
-                        data = response.json()
-
-                        # If case_text is blank, try again with isOld=true
-                        if (
-                            not data.get("case_text")
-                            or len(data.get("case_text", "").strip()) == 0
-                        ):
-                            print(
-                                f"Blank case_text found, retrying with isOld=true for: {url}"
-                            )
-                            full_url = f"{CLOUDFLARE_URL}/scrape/cases?url={requests.utils.quote(f'https://www.elitigation.sg{url}')}&isOld=true"
-                            print(f"Second attempt: {full_url}")
-
-                            response = fetch_with_retry(full_url)
-                            if isinstance(response, requests.Response) and response.ok:
-                                data = response.json()
-
-                        data["url"] = url
-                        results.append(data)
-                    else:
-                        error_msg = (
-                            response.get("error")
-                            if isinstance(response, dict)
-                            else f"HTTP error! Status: {response.status_code}"
-                        )
-                        results.append(
-                            {"url": url, "status": "error", "error": error_msg}
-                        )
-                except Exception as e:
-                    results.append({"url": url, "status": "error", "error": str(e)})
-
-            # Store results in database
-            for result in results:
-                if result.get("status") == "error":
-                    print(f"Error scraping {result['url']}: {result['error']}")
+
+                case_urls = orjson.loads(cases_response.content)
+                if not case_urls or not len(case_urls):
+                    print(f"No cases found on page {page_index}, stopping pagination")
+                    has_more_pages = False
+                    pages_processed_count = page_index - 1  # Record actual pages attempted
+                    break
+
+                print(f"Found {len(case_urls)} cases on page {page_index}")
+                current_page_processed = True
+
+                # Limit the number of cases processed per page if needed
+                cases_to_process = case_urls[: CONFIG["maxEntriesPerPage"]]
+
+                # Check which URLs have already been processed; URLs recorded as
+                # errors are retried but don't count as new cases
+                url_statuses = fetch_url_statuses(cases_to_process)
+                urls_to_process = [
+                    url for url in cases_to_process if not url_statuses.get(url)
+                ]
+                new_urls = [url for url in urls_to_process if url not in url_statuses]
+
+                print(
+                    f"{len(urls_to_process)} cases need processing on page {page_index} ({len(new_urls)} new)"
+                )
+
+                # If no new cases on this page, increment the counter
+                if not new_urls:
+                    consecutive_pages_with_no_new_cases += 1
+                    # If we've seen 3 consecutive pages with no new cases, assume we've caught up
+                    if consecutive_pages_with_no_new_cases >= 3:
+                        print("Found 3 consecutive pages with no new cases. Stopping.")
+                        break
+                else:
+                    # Reset the counter if we found new cases
+                    consecutive_pages_with_no_new_cases = 0
+
+                if not urls_to_process:
+                    # Continue to next page; its sitemap is already fetched, so
+                    # there is no request to space out
+                    page_index += 1
+                    pages_processed_count = page_index - 1  # Update before continue
                     continue
 
-                try:
-                    case_id = insert_case_law(result, result["url"])
-                    if case_id:
-                        new_cases_found += 1
-                except Exception as e:
-                    print(f"Failed to insert case from {result['url']}: {e}")
-
-            # Add a delay between pages
-            if page_index < max_pages_to_process:
-                sleep(CONFIG["requestInterval"])
-
-            page_index += 1
-            if (
-                current_page_processed
-            ):  # Only increment if the page was actually processed (not skipped early)
-                pages_processed_count = page_index - 1
-
-        print(
-            f"Singapore case law scraping completed. Found {new_cases_found} new cases. Processed {pages_processed_count} pages."
-        )
-
-        # Job completed successfully
-        complete_job(
-            supabase,
-            job_run_id,
-            {
-                "new_cases_found": new_cases_found,
-                "pages_processed": pages_processed_count,
-            },
-        )
+                # Scrape this page's cases concurrently (results keep URL order)
+                with ThreadPoolExecutor(
+                    max_workers=CONFIG["maxConcurrentRequests"]
+                ) as executor:
+                    results = list(executor.map(fetch_case, urls_to_process))
 
-    except Exception as e:
-        error_message = str(e)
-        print(f"Fatal error in Singapore case law scraping: {e}")
+                # Collect the results to store; duplicate citations are skipped
+                # by the database on insert
+                cases_to_insert = []
+                for result in results:
+                    if result.get("status") == "error":
+                        print(f"Error scraping {result['url']}: {result['error']}")
+                        continue
 
-        # Log the failure
-        fail_job(
-            supabase,
-            job_run_id,
-            {
-                "new_cases_found": new_cases_found,
-                "pages_processed": pages_processed_count,
-            },
-            error_message,
-        )
+                    cases_to_insert.append(result)
+
+                # Store results in database
+                processing_date = time.strftime("%Y-%m-%d %H:%M:%S")
+                inserted, tracking_rows = insert_case_laws(cases_to_insert, processing_date)
+                new_cases_found += len(inserted)
+
+                # Record this page's URL outcomes in one round trip
+                record_processed_urls(tracking_rows)
+
+                # Add a delay between pages
+                if page_index < max_pages_to_process:
+                    sleep(CONFIG["requestInterval"])
+
+                page_index += 1
+                if (
+                    current_page_processed
+                ):  # Only increment if the page was actually processed (not skipped early)
+                    pages_processed_count = page_index - 1
 
-        raise e  # Re-raise the exception after logging
+            print(
+                f"Singapore case law scraping completed. Found {new_cases_found} new cases. Processed {pages_processed_count} pages."
+            )
+
+        except Exception as e:
+            print(f"Fatal error in Singapore case law scraping: {e}")
+            raise e  # Re-raise so track_job records the failure
+
+        finally:
+            metrics["new_cases_found"] = new_cases_found
+            metrics["pages_processed"] = pages_processed_count
 
 
 def test_cloudflare_api():
@@ -362,11 +465,11 @@ def test_cloudflare_api():
     """
     test_url = f"{CLOUDFLARE_URL}/sitemap/cases?index=1"
     print(f"Testing API: {test_url}")
-    response = requests.get(test_url)
+    response = SESSION.get(test_url)
     if not response.ok:
         print(f"API request failed with status code: {response.status_code}")
         return
-    data = response.json()
+    data = orjson.loads(response.content)
     print(f"Number of case URLs returned: {len(data)}")
     if data:
         print(f"Sample case URL: {data[0]}")
@@ -381,53 +484,73 @@ def test_fetch_case_data_for_first_10():
     """
     test_url = f"{CLOUDFLARE_URL}/sitemap/cases?index=1"
     print(f"Testing API: {test_url}")
-    response = requests.get(test_url)
+    response = SESSION.get(test_url)
     if not response.ok:
         print(f"API request failed with status code: {response.status_code}")
         return
-    case_urls = response.json()
+    case_urls = orjson.loads(response.content)
     print(f"Number of case URLs returned: {len(case_urls)}")
     for i, case_url in enumerate(case_urls[:10]):
         print(f"\nFetching case {i+1}: {case_url}")
-        full_url = f"{CLOUDFLARE_URL}/scrape/cases?url={requests.utils.quote('https://www.elitigation.sg' + case_url)}"
-        case_response = requests.get(full_url)
+        full_url = f"{CLOUDFLARE_URL}/scrape/cases?url={quote('https://www.elitigation.sg' + case_url)}"
+        case_response = SESSION.get(full_url)
         if not case_response.ok:
             print(f"  Failed to fetch case data (status {case_response.status_code})")
             continue
-        data = case_response.json()
+        data = orjson.loads(case_response.content)
         print(f"  Case Name: {data.get('case_name')}")
         print(f"  Citation: {data.get('citation')}")
         text_snippet = (data.get("case_text") or "")[:200].replace("\n", " ")
         print(f"  Text Snippet: {text_snippet}...")
 
 
+# Binding court patterns with standardized names, in priority order
+COURT_PATTERNS = {
+    r"court\s+of\s+appeal": "Court of Appeal",
+    r"high\s+court\s+appellate\s+division": "High Court (Appellate Division)",
+    r"high\s+court\s+general\s+division": "High Court (General Division)",
+    r"singapore\s+international\s+commercial\s+court": "Singapore International Commercial Court (SICC)",
+    r"family\s+justice\s+courts": "Family Justice Courts",
+    r"court\s+of\s+three\s+judges|court\s+of\s+3\s+judges": "Court of Three Judges",
+    r"high\s+court": "High Court",
+}
+_COURT_NAMES = {f"k{i}": name for i, name in enumerate(COURT_PATTERNS.values())}
+# Each branch is a lookahead over the whole string, so the first pattern in
+# priority order wins (not the leftmost match); lastgroup names the branch.
+_COURT_RE = re.compile(
+    "^(?:"
+    + "|".join(
+        f"(?=.*?(?:{pattern}))(?P<k{i}>)"
+        for i, pattern in enumerate(COURT_PATTERNS)
+    )
+    + ")",
+    re.DOTALL,
+)
+_COURT_CLEAN_RE = re.compile(r"\$\$.*?\$\$|&emsp;|fig\.\s*\d*|\d+")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
 def standardize_court_name(raw_court):
     """Standardize court names and filter for binding precedents only"""
+    # Missing court names short-circuit here so they never take a cache slot
     if not raw_court:
         return None
 
+    return _standardize_court_name(raw_court)
+
+
+@lru_cache(maxsize=2048)
+def _standardize_court_name(raw_court):
+    """Cached body of standardize_court_name, keyed on the raw court string"""
     # Clean the input
-    cleaned = re.sub(
-        r"\$\$.*?\$\$|&emsp;|fig\.\s*\d*|\d+", "", raw_court
-    )  # Remove citations and special chars
-    cleaned = re.sub(r"\s+", " ", cleaned).strip()  # Normalize whitespace
+    cleaned = _COURT_CLEAN_RE.sub("", raw_court)  # Remove citations and special chars
+    cleaned = _WHITESPACE_RE.sub(" ", cleaned).strip()  # Normalize whitespace
     cleaned = cleaned.lower()
 
-    # Define binding court patterns with standardized names
-    court_patterns = {
-        r"court\s+of\s+appeal": "Court of Appeal",
-        r"high\s+court\s+appellate\s+division": "High Court (Appellate Division)",
-        r"high\s+court\s+general\s+division": "High Court (General Division)",
-        r"singapore\s+international\s+commercial\s+court": "Singapore International Commercial Court (SICC)",
-        r"family\s+justice\s+courts": "Family Justice Courts",
-        r"court\s+of\s+three\s+judges|court\s+of\s+3\s+judges": "Court of Three Judges",
-        r"high\s+court": "High Court",
-    }
-
-    # Try to match against patterns
-    for pattern, standard_name in court_patterns.items():
-        if re.search(pattern, cleaned):
-            return standard_name
+    # Match against all patterns in one pass
+    match = _COURT_RE.match(cleaned)
+    if match:
+        return _COURT_NAMES[match.lastgroup]
 
     return None  # Not a binding court
 
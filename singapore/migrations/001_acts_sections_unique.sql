@@ -0,0 +1,8 @@
+-- Unique keys used as ON CONFLICT targets by the acts/sections upserts in
+-- acts_index.py. Remove any existing duplicate rows before applying.
+
+alter table acts
+    add constraint acts_source_id_key unique (source_id);
+
+alter table sections
+    add constraint sections_act_id_section_title_key unique (act_id, section_title);
@@ -0,0 +1,5 @@
+-- Store sections.additional as jsonb. The scrapers send it as a JSON object
+-- rather than a pre-serialized string.
+
+alter table sections
+    alter column additional type jsonb using additional::jsonb;
@@ -0,0 +1,46 @@
+-- Let the database reject duplicate citations instead of checking them
+-- client-side before each insert. Remove any existing duplicate citations
+-- before applying.
+
+create unique index caselaw_singapore_citation_key
+    on caselaw_singapore (citation)
+    where citation is not null;
+
+-- Insert a batch of cases, skipping rows whose citation already exists.
+-- Returns one row per inserted case; row_index is the 1-based position of
+-- the case in the input array so callers can match results to their rows.
+create or replace function upsert_caselaw_singapore(rows jsonb)
+returns table (
+    row_index integer,
+    case_id caselaw_singapore.id%type,
+    case_name text
+)
+language plpgsql
+as $$
+declare
+    r record;
+    new_id caselaw_singapore.id%type;
+begin
+    for r in
+        select t.case_row, t.ord
+        from jsonb_array_elements(rows) with ordinality as t(case_row, ord)
+    loop
+        insert into caselaw_singapore (
+            standard_court_name, case_name, case_no, date, case_text, citation, country
+        )
+        select
+            p.standard_court_name, p.case_name, p.case_no, p.date, p.case_text,
+            p.citation, p.country
+        from jsonb_populate_record(null::caselaw_singapore, r.case_row) as p
+        on conflict (citation) where citation is not null do nothing
+        returning caselaw_singapore.id into new_id;
+
+        if found then
+            row_index := r.ord;
+            case_id := new_id;
+            case_name := r.case_row ->> 'case_name';
+            return next;
+        end if;
+    end loop;
+end;
+$$;
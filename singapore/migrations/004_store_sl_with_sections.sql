@@ -0,0 +1,40 @@
+-- Store a Subsidiary Legislation and its sections in one call and one
+-- transaction, used by store_in_supabase in subsidiary_acts.py. Relies on the
+-- unique constraints from 001_acts_sections_unique.sql.
+--
+-- The SL is upserted on source_id (refreshing its metadata) and sections are
+-- inserted with duplicate (act_id, section_title) pairs skipped. Returns the
+-- SL's act_id and the number of sections actually inserted.
+
+create or replace function store_sl_with_sections(act jsonb, sections jsonb)
+returns table (sl_act_id acts.act_id%type, new_sections integer)
+language plpgsql
+as $$
+declare
+    v_act_id acts.act_id%type;
+    v_count integer;
+begin
+    insert into acts (act_name, act_description, country, source, source_id, parent_id)
+    select a.act_name, a.act_description, a.country, a.source, a.source_id, a.parent_id
+    from jsonb_populate_record(null::acts, act) as a
+    on conflict (source_id) do update
+        set act_name = excluded.act_name,
+            act_description = excluded.act_description,
+            country = excluded.country,
+            source = excluded.source,
+            parent_id = excluded.parent_id
+    returning acts.act_id into v_act_id;
+
+    insert into sections (
+        act_id, section_title, section_content, country, questions, cot_pairs, additional
+    )
+    select
+        v_act_id, s.section_title, s.section_content, s.country, s.questions,
+        s.cot_pairs, s.additional
+    from jsonb_populate_recordset(null::sections, sections) as s
+    on conflict (act_id, section_title) do nothing;
+    get diagnostics v_count = row_count;
+
+    return query select v_act_id, v_count;
+end;
+$$;
@@ -0,0 +1,26 @@
+-- Bulk-load sections in one statement, used by store_in_supabase in
+-- subsidiary_acts.py for SLs too large to send in a single
+-- store_sl_with_sections call. Each row in payload carries its act_id.
+-- Rows whose (act_id, section_title) already exists are skipped. Returns the
+-- number of sections actually inserted.
+
+create or replace function sections_bulk_insert(payload jsonb)
+returns integer
+language plpgsql
+as $$
+declare
+    v_count integer;
+begin
+    insert into sections (
+        act_id, section_title, section_content, country, questions, cot_pairs, additional
+    )
+    select
+        s.act_id, s.section_title, s.section_content, s.country, s.questions,
+        s.cot_pairs, s.additional
+    from jsonb_populate_recordset(null::sections, payload) as s
+    on conflict (act_id, section_title) do nothing;
+    get diagnostics v_count = row_count;
+
+    return v_count;
+end;
+$$;
@@ -0,0 +1,48 @@
+-- Keep the ETag and Last-Modified headers of each scraped SL page so
+-- subsidiary_acts.py can revalidate it with a conditional GET and skip
+-- pages the server answers with 304 Not Modified. Redefines
+-- store_sl_with_sections (004_store_sl_with_sections.sql) to store them.
+
+alter table acts
+    add column etag text,
+    add column last_modified text;
+
+create or replace function store_sl_with_sections(act jsonb, sections jsonb)
+returns table (sl_act_id acts.act_id%type, new_sections integer)
+language plpgsql
+as $$
+declare
+    v_act_id acts.act_id%type;
+    v_count integer;
+begin
+    insert into acts (
+        act_name, act_description, country, source, source_id, parent_id,
+        etag, last_modified
+    )
+    select
+        a.act_name, a.act_description, a.country, a.source, a.source_id,
+        a.parent_id, a.etag, a.last_modified
+    from jsonb_populate_record(null::acts, act) as a
+    on conflict (source_id) do update
+        set act_name = excluded.act_name,
+            act_description = excluded.act_description,
+            country = excluded.country,
+            source = excluded.source,
+            parent_id = excluded.parent_id,
+            etag = excluded.etag,
+            last_modified = excluded.last_modified
+    returning acts.act_id into v_act_id;
+
+    insert into sections (
+        act_id, section_title, section_content, country, questions, cot_pairs, additional
+    )
+    select
+        v_act_id, s.section_title, s.section_content, s.country, s.questions,
+        s.cot_pairs, s.additional
+    from jsonb_populate_recordset(null::sections, sections) as s
+    on conflict (act_id, section_title) do nothing;
+    get diagnostics v_count = row_count;
+
+    return query select v_act_id, v_count;
+end;
+$$;
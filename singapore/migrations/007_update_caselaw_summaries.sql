@@ -0,0 +1,20 @@
+-- Write a batch of case summaries in one statement, used by process_batch in
+-- summarize_cases.py. Each element of rows is {"id": ..., "summary": ...}.
+-- Returns the number of cases updated.
+
+create or replace function update_caselaw_summaries(rows jsonb)
+returns integer
+language plpgsql
+as $$
+declare
+    v_count integer;
+begin
+    update caselaw_singapore c
+    set summary = r.summary
+    from jsonb_populate_recordset(null::caselaw_singapore, rows) as r
+    where c.id = r.id;
+    get diagnostics v_count = row_count;
+
+    return v_count;
+end;
+$$;
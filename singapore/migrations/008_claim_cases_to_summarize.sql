@@ -0,0 +1,31 @@
+-- Atomically claim cases for summarize_cases.py, so concurrent or restarted
+-- runs never summarize the same case twice. Claimed cases get the
+-- placeholder summary '__CLAIMED__' until their real summary is written;
+-- summarize_cases.py resets claims it could not finish back to null. If a
+-- run dies before that, free its claims with:
+--   update caselaw_singapore set summary = null where summary = '__CLAIMED__';
+
+create or replace function claim_cases_to_summarize(batch_size integer)
+returns table (
+    id caselaw_singapore.id%type,
+    case_text caselaw_singapore.case_text%type,
+    standard_court_name caselaw_singapore.standard_court_name%type
+)
+language plpgsql
+as $$
+begin
+    return query
+    update caselaw_singapore c
+    set summary = '__CLAIMED__'
+    where c.id in (
+        select s.id
+        from caselaw_singapore s
+        where s.summary is null
+            and s.case_text <> ''
+            and s.standard_court_name is not null
+        limit batch_size
+        for update skip locked
+    )
+    returning c.id, c.case_text, c.standard_court_name;
+end;
+$$;
@@ -0,0 +1,12 @@
+-- Index only the cases still waiting for a summary, matching the filter in
+-- claim_cases_to_summarize (008_claim_cases_to_summarize.sql), so claiming
+-- reads just those rows instead of scanning the whole table. Rows drop out
+-- of the index once they are summarized. Replaced in
+-- 011_caselaw_singapore_summary_claims.sql, where claiming no longer
+-- touches summary.
+
+create index caselaw_singapore_unsummarized_idx
+    on caselaw_singapore (id)
+    where summary is null
+        and case_text <> ''
+        and standard_court_name is not null;
@@ -0,0 +1,9 @@
+-- Case summaries keyed by the sha256 hex digest of the case_text they were
+-- generated from, so summarize_cases.py can reuse a summary for cases with
+-- identical text (standard orders, templates) instead of calling the LLM
+-- again.
+
+create table if not exists summary_cache (
+    hash text primary key,
+    summary text not null
+);
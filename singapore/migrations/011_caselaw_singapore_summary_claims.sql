@@ -0,0 +1,58 @@
+-- Track summarization claims in their own column instead of writing a
+-- '__CLAIMED__' placeholder into summary (008_claim_cases_to_summarize.sql),
+-- so summary only ever holds NULL or a real summary. A claim older than
+-- claim_timeout_minutes is treated as abandoned (the run that made it
+-- crashed or was killed) and the case can be claimed again.
+
+alter table caselaw_singapore
+    add column summary_claimed_at timestamptz;
+
+-- Undo placeholders left by the previous version of the claim
+update caselaw_singapore
+set summary = null
+where summary = '__CLAIMED__';
+
+-- Claimed rows keep summary null and so stay in the unsummarized index
+-- (009_caselaw_singapore_unsummarized_index.sql); key it on the claim time
+-- so claiming skips live claims in the index rather than in the table
+drop index if exists caselaw_singapore_unsummarized_idx;
+
+create index caselaw_singapore_unsummarized_idx
+    on caselaw_singapore (summary_claimed_at)
+    where summary is null
+        and case_text <> ''
+        and standard_court_name is not null;
+
+drop function if exists claim_cases_to_summarize(integer);
+
+create or replace function claim_cases_to_summarize(
+    batch_size integer,
+    claim_timeout_minutes integer default 60
+)
+returns table (
+    id caselaw_singapore.id%type,
+    case_text caselaw_singapore.case_text%type,
+    standard_court_name caselaw_singapore.standard_court_name%type
+)
+language plpgsql
+as $$
+begin
+    return query
+    update caselaw_singapore c
+    set summary_claimed_at = now()
+    where c.id in (
+        select s.id
+        from caselaw_singapore s
+        where s.summary is null
+            and s.case_text <> ''
+            and s.standard_court_name is not null
+            and (
+                s.summary_claimed_at is null
+                or s.summary_claimed_at < now() - make_interval(mins => claim_timeout_minutes)
+            )
+        limit batch_size
+        for update skip locked
+    )
+    returning c.id, c.case_text, c.standard_court_name;
+end;
+$$;
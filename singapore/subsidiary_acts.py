@@ -2,12 +2,21 @@ import json
 import logging
 import os
 import re
-import time  # For potential delays
-from urllib.parse import urljoin, urlparse  # Keep urljoin, urlparse
+import string
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ThreadPoolExecutor,
+    wait,
+)
+from itertools import count
 
 import requests
-from bs4 import BeautifulSoup
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from selectolax.lexbor import LexborHTMLParser
+from urllib3.util.retry import Retry
+from utils.rate_limiter import RateLimiter
 
 from supabase import Client, create_client
 
@@ -41,6 +50,17 @@ except Exception as e:
 
 # --- Supabase Helper Functions ---
 
+# SL columns that must be non-empty
+_ACT_REQUIRED_COLS = ("act_name", "country")
+# Section columns: required on every row, and allowed to be sent as NULL
+_SECTION_REQUIRED_COLS = frozenset(("section_title", "section_content", "country"))
+_SECTION_NULLABLE_COLS = frozenset(("questions", "cot_pairs", "additional"))
+# Sections per RPC call; only a payload-size cap, most SLs fit in one call
+SECTION_RPC_BATCH_SIZE = 2000
+# source_ids per IN query when loading stored HTTP validators
+VALIDATOR_LOOKUP_BATCH_SIZE = 200
+_HTTP_VALIDATOR_COLS = ("etag", "last_modified")
+
 
 def get_existing_act(source_id: str, supabase_client: Client) -> dict | None:
     """
@@ -89,30 +109,52 @@ def get_act_id_by_source_id(source_id: str, supabase_client: Client) -> int | No
         return None
 
 
-def get_existing_sections(act_id: int, supabase_client: Client) -> list:
+# Parent act_id by source_id for the current batch; see get_parent_act_id
+_parent_act_ids = {}
+
+
+def get_parent_act_id(source_id: str) -> int | None:
     """
-    Get existing section titles for a specific act_id.
+    get_act_id_by_source_id against the module client, memoized because many
+    SLs share the same parent Act. Only found ids are cached: None means
+    either "not in the database" or a failed lookup, so it is looked up again
+    for the next SL. Cleared at the start of each batch
+    (scrape_and_store_multiple_sls) so Acts added between runs are seen.
     """
-    if not act_id:
-        logging.warning("Attempted to get existing sections with invalid act_id.")
-        return []
-    try:
-        # logging.debug(f"Fetching existing sections for act_id {act_id}...")
-        response = (
-            supabase_client.table("sections")
-            .select("section_title")
-            .eq("act_id", act_id)
-            .execute()
-        )
+    act_id = _parent_act_ids.get(source_id)
+    if act_id is None:
+        act_id = get_act_id_by_source_id(source_id, supabase)
+        if act_id is not None:
+            _parent_act_ids[source_id] = act_id
+    return act_id
 
-        if hasattr(response, "data") and response.data:
-            # logging.debug(f"Found {len(response.data)} existing sections for act_id {act_id}.")
-            return response.data
-        # logging.debug(f"No existing sections found for act_id {act_id}.")
-        return []
+
+def get_http_validators(source_ids: list, supabase_client: Client) -> dict:
+    """
+    Get the stored ETag/Last-Modified of the given acts, keyed by source_id,
+    using one IN query per VALIDATOR_LOOKUP_BATCH_SIZE source_ids. Acts
+    without either value are left out, and so are acts stored without a
+    parent_id: their page is fetched in full so the parent link is looked up
+    again, and repaired once the parent Act is in the database.
+    """
+    validators = {}
+    try:
+        for i in range(0, len(source_ids), VALIDATOR_LOOKUP_BATCH_SIZE):
+            response = (
+                supabase_client.table("acts")
+                .select("source_id, etag, last_modified, parent_id")
+                .in_("source_id", source_ids[i : i + VALIDATOR_LOOKUP_BATCH_SIZE])
+                .execute()
+            )
+            for row in response.data:
+                if row.get("parent_id") is not None and (
+                    row.get("etag") or row.get("last_modified")
+                ):
+                    validators[row["source_id"]] = row
     except Exception as e:
-        logging.error(f"Error fetching existing sections for act_id {act_id}: {e}")
-        return []
+        # Without validators every page is simply fetched in full
+        logging.error(f"Error loading stored ETag/Last-Modified values: {e}")
+    return validators
 
 
 def store_in_supabase(
@@ -121,8 +163,18 @@ def store_in_supabase(
     """
     Inserts Subsidiary Legislation (SL) and its Sections into Supabase,
     handling existing data and parent_id linkage.
+
+    Everything is sent in one store_sl_with_sections RPC call
+    (migrations/004_store_sl_with_sections.sql), so the SL upsert and the
+    section inserts share one round-trip and one transaction. The SL is
+    upserted on source_id and sections already stored for it (same
+    section_title) are skipped by the database.
+
+    The page's ETag/Last-Modified (act_data["etag"], act_data["last_modified"])
+    are stored only once every section is in, and only if there is at least
+    one section, so a partly stored SL or a page that failed to parse is not
+    skipped as unchanged on the next run.
     """
-    inserted_act_id = None
     sl_source_id = act_data.get("source_id")
     sl_name_for_logs = act_data.get("act_name", f"Unknown SL ({sl_source_id})")
 
@@ -134,206 +186,132 @@ def store_in_supabase(
         )
         return False
 
-    # 1. Check if SL already exists by source_id
-    existing_sl = get_existing_act(sl_source_id, supabase_client)
-
-    if existing_sl:
-        inserted_act_id = existing_sl["act_id"]
-        logging.info(
-            f"SL '{sl_name_for_logs}' (source_id: {sl_source_id}) already exists with act_id: {inserted_act_id}."
-        )
-        # Optional: Update existing SL metadata if needed (e.g., description, name)
-        # Consider implementing an update mechanism if required.
-        # try:
-        #     update_data = {k: v for k, v in act_data.items() if k != 'source_id' and v is not None}
-        #     # Ensure parent_id isn't accidentally removed if not in update_data but exists
-        #     if 'parent_id' not in update_data and existing_sl.get('parent_id'):
-        #          update_data['parent_id'] = existing_sl.get('parent_id')
-        #     if update_data:
-        #         supabase_client.table('acts').update(update_data).eq('act_id', inserted_act_id).execute()
-        #         logging.info(f"Updated metadata for existing SL act_id: {inserted_act_id}")
-        # except Exception as e:
-        #     logging.error(f"Error updating metadata for existing SL act_id {inserted_act_id}: {e}")
-
-    else:
-        # 2. Insert new SL
-        try:
-            # Prepare SL data: Remove None values unless column allows NULL
-            sl_to_insert = {
-                k: v
-                for k, v in act_data.items()
-                # Ensure parent_id is included, even if None
-                if v is not None
-                or k in ["act_description", "source", "source_id", "parent_id"]
-            }
-            if not sl_to_insert.get("act_name") or not sl_to_insert.get("country"):
-                logging.error("Error: SL name and country are required for insertion.")
-                return False
-            # Ensure parent_id is handled correctly (NULL if not found/provided)
-            sl_to_insert["parent_id"] = sl_to_insert.get(
-                "parent_id"
-            )  # Explicitly set to None if not present
-
-            logging.info(f"Attempting to insert SL: {sl_name_for_logs}")
-            logging.debug(
-                f"SL data for insertion: {json.dumps(sl_to_insert, indent=2)}"
-            )
-            sl_insert_response = (
-                supabase_client.table("acts").insert(sl_to_insert).execute()
-            )
-
-            if hasattr(sl_insert_response, "data") and sl_insert_response.data:
-                inserted_act_id = sl_insert_response.data[0]["act_id"]
-                logging.info(
-                    f"Successfully inserted SL '{sl_name_for_logs}', got act_id: {inserted_act_id}"
-                )
-            else:
-                error_message = "Unknown error during SL insertion."
-                if hasattr(sl_insert_response, "error") and sl_insert_response.error:
-                    error_message = sl_insert_response.error.message
-                elif hasattr(sl_insert_response, "message"):
-                    error_message = sl_insert_response.message
-                logging.error(
-                    f"Error inserting SL '{sl_name_for_logs}': {error_message}"
-                )
-                logging.debug(f"Full SL Insert Response: {sl_insert_response}")
-                # If parent_id constraint fails, it might show up here
-                if (
-                    "violates foreign key constraint" in error_message
-                    and "parent_id" in error_message
-                ):
-                    logging.error(
-                        f"Potential issue: The parent_id ({act_data.get('parent_id')}) might not exist in the acts table."
-                    )
-                return False
-
-        except Exception as e:
-            logging.error(
-                f"An exception occurred during SL insertion for '{sl_name_for_logs}': {e}"
-            )
-            return False
-
-    # 3. Handle Sections (Insert new ones)
-    if not inserted_act_id:
-        logging.error(
-            f"Cannot insert sections as act_id was not obtained for '{sl_name_for_logs}'."
-        )
-        return False
-
-    # Get existing section titles for this act_id to avoid duplicates
-    existing_sections = get_existing_sections(inserted_act_id, supabase_client)
-    existing_section_titles = {
-        section["section_title"] for section in existing_sections
+    # 1. Prepare SL data: Remove None values unless column allows NULL
+    sl_to_insert = {
+        k: v
+        for k, v in act_data.items()
+        # Ensure parent_id is included, even if None
+        if v is not None or k in ["act_description", "source", "source_id", "parent_id"]
     }
-    logging.info(
-        f"Found {len(existing_section_titles)} existing sections for SL act_id {inserted_act_id}."
-    )
-
-    # Filter out sections that already exist based on title
-    new_sections_data = [
-        section
+    if not all(sl_to_insert.get(k) for k in _ACT_REQUIRED_COLS):
+        logging.error("Error: SL name and country are required for insertion.")
+        return False
+    # Ensure parent_id is handled correctly (NULL if not found/provided)
+    sl_to_insert["parent_id"] = sl_to_insert.get(
+        "parent_id"
+    )  # Explicitly set to None if not present
+
+    # 2. Prepare sections in one pass: Remove None values unless column allows
+    # NULL, and keep only rows with every required field. act_id is filled in
+    # by the database.
+    sections_to_insert = [
+        section_prepared
         for section in all_sections_data
-        if section.get("section_title") not in existing_section_titles
+        if (
+            section_prepared := {
+                k: v
+                for k, v in section.items()
+                if v is not None or k in _SECTION_NULLABLE_COLS
+            }
+        ).keys()
+        >= _SECTION_REQUIRED_COLS
     ]
 
-    if not new_sections_data:
-        logging.info(
-            f"No new sections found to insert for SL act_id {inserted_act_id}."
+    skipped_count = len(all_sections_data) - len(sections_to_insert)
+    if skipped_count:
+        logging.warning(
+            f"Skipped {skipped_count} of {len(all_sections_data)} sections due to missing required fields for SL '{sl_name_for_logs}'."
         )
-        return True  # SL exists or was inserted, no new sections needed
-
-    logging.info(
-        f"Found {len(new_sections_data)} new sections to insert for SL act_id {inserted_act_id}."
-    )
-
-    # Prepare sections for batch insertion
-    sections_to_insert = []
-    for section in new_sections_data:
-        section["act_id"] = inserted_act_id  # Link section to the SL
-
-        # Prepare section data: Remove None values unless column allows NULL
-        section_prepared = {
-            k: v
-            for k, v in section.items()
-            if v is not None or k in ["questions", "cot_pairs", "additional"]
-        }
-
-        # Basic validation for required fields
-        if not all(
-            key in section_prepared
-            for key in ["section_title", "section_content", "act_id", "country"]
-        ):
-            logging.warning(
-                f"Skipping section due to missing required fields: {section_prepared.get('section_title', 'NO TITLE')} for SL act_id {inserted_act_id}"
-            )
-            continue
-
-        sections_to_insert.append(section_prepared)
 
+    # No sections usually means the page failed to parse; store the SL
+    # without validators so the next run fetches it in full again
     if not sections_to_insert:
-        logging.warning(
-            f"All {len(new_sections_data)} potential new sections were filtered out due to missing data for SL act_id {inserted_act_id}."
-        )
-        return True  # SL part was successful
+        for k in _HTTP_VALIDATOR_COLS:
+            sl_to_insert.pop(k, None)
+
+    # Oversized SLs are stored over several calls; hold the validators back
+    # until the last one succeeds
+    deferred_validators = {}
+    if len(sections_to_insert) > SECTION_RPC_BATCH_SIZE:
+        deferred_validators = {
+            k: sl_to_insert.pop(k, None) for k in _HTTP_VALIDATOR_COLS
+        }
 
-    # Batch insert sections
+    # 3. Store SL and the first batch of sections in one call; errors raise
+    # from execute()
     try:
         logging.info(
-            f"Attempting to insert {len(sections_to_insert)} new sections linked to SL act_id {inserted_act_id}..."
+            f"Attempting to store SL '{sl_name_for_logs}' with {len(sections_to_insert)} sections..."
         )
-        batch_size = 100  # Adjust as needed
-        all_sections_inserted = True
-
-        for i in range(0, len(sections_to_insert), batch_size):
-            batch = sections_to_insert[i : i + batch_size]
-            logging.info(
-                f"  Inserting section batch {i // batch_size + 1} ({len(batch)} sections)..."
-            )
-            sections_insert_response = (
-                supabase_client.table("sections").insert(batch).execute()
-            )
-
-            if not (
-                hasattr(sections_insert_response, "data")
-                and sections_insert_response.data
-            ):
-                error_message = f"Unknown error during Section batch insertion (Batch {i // batch_size + 1})."
-                if (
-                    hasattr(sections_insert_response, "error")
-                    and sections_insert_response.error
-                ):
-                    error_message = sections_insert_response.error.message
-                elif hasattr(sections_insert_response, "message"):
-                    error_message = sections_insert_response.message
-                logging.error(
-                    f"Error inserting Sections for SL act_id {inserted_act_id}: {error_message}"
-                )
-                logging.debug(
-                    f"Full Section Insert Response: {sections_insert_response}"
-                )
-                all_sections_inserted = False
-                break  # Stop inserting further batches on error
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug(f"SL data for upsert: {json.dumps(sl_to_insert, indent=2)}")
+        response = supabase_client.rpc(
+            "store_sl_with_sections",
+            {
+                "act": sl_to_insert,
+                "sections": sections_to_insert[:SECTION_RPC_BATCH_SIZE],
+            },
+        ).execute()
+
+        result = response.data[0]
+        inserted_act_id = result["sl_act_id"]
+        new_sections_count = result["new_sections"]
+
+        # 4. Bulk-load any remaining sections, one statement per batch
+        for i in range(
+            SECTION_RPC_BATCH_SIZE, len(sections_to_insert), SECTION_RPC_BATCH_SIZE
+        ):
+            batch = [
+                {**section, "act_id": inserted_act_id}
+                for section in sections_to_insert[i : i + SECTION_RPC_BATCH_SIZE]
+            ]
+            response = supabase_client.rpc(
+                "sections_bulk_insert", {"payload": batch}
+            ).execute()
+            new_sections_count += response.data
+
+        if any(deferred_validators.values()):
+            supabase_client.table("acts").update(deferred_validators).eq(
+                "act_id", inserted_act_id
+            ).execute()
 
-        if all_sections_inserted:
-            logging.info(
-                f"Successfully inserted all {len(sections_to_insert)} new sections for SL act_id {inserted_act_id}."
-            )
-            return True
-        else:
-            logging.error(
-                f"Section insertion failed for one or more batches for SL act_id {inserted_act_id}."
-            )
-            return False  # Indicate partial failure
+        logging.info(
+            f"Successfully stored SL '{sl_name_for_logs}' (act_id: {inserted_act_id}): {new_sections_count} new sections, {len(sections_to_insert) - new_sections_count} already existed."
+        )
+        return True
 
     except Exception as e:
+        error_message = str(e)
         logging.error(
-            f"An exception occurred during Section insertion for SL act_id {inserted_act_id}: {e}"
+            f"An exception occurred while storing SL '{sl_name_for_logs}': {error_message}"
         )
+        # If parent_id constraint fails, it might show up here
+        if (
+            "violates foreign key constraint" in error_message
+            and "parent_id" in error_message
+        ):
+            logging.error(
+                f"Potential issue: The parent_id ({act_data.get('parent_id')}) might not exist in the acts table."
+            )
         return False
 
 
 # --- Configuration ---
 BASE_URL = "https://sso.agc.gov.sg"
+MAX_SCRAPE_WORKERS = 8  # SL pages fetched concurrently; also caps load on the site
+SSO_REQUESTS_PER_SECOND = 5  # Average request rate to sso.agc.gov.sg across all threads
+# Paces every page request (SL and browse pages) made by this module;
+# throttling responses are handled by the session's Retry-After-aware retries
+_request_limiter = RateLimiter(SSO_REQUESTS_PER_SECOND, burst=SSO_REQUESTS_PER_SECOND)
+# Returned by scrape_subsidiary_legislation in place of sl_data when the page
+# is unchanged since it was last stored (HTTP 304)
+SL_NOT_MODIFIED = object()
+
+
+def _source_id(path: str) -> str:
+    """Last segment of an /SL/ or /Act/ path, e.g. "/SL/AA2004-R5" -> "AA2004-R5"."""
+    return path.rstrip("/").rsplit("/", 1)[-1]
+
 
 # --- Request Headers (Base) ---
 base_headers = {
@@ -352,10 +330,95 @@ base_headers = {
 }
 
 
+# --- HTTP Session ---
+def create_session() -> requests.Session:
+    """
+    Creates a requests Session for sso.agc.gov.sg with the base headers set once
+    and a connection pool large enough for every scrape worker, so connections
+    are kept alive and reused across SLs. Transient errors (429/5xx) are retried
+    with exponential backoff, waiting as long as any Retry-After header asks.
+    """
+    session = requests.Session()
+    session.headers.update(base_headers)
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=5,
+            backoff_factor=1.0,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset(["GET"]),
+            respect_retry_after_header=True,
+        ),
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+# --- Precompiled Patterns ---
+_PROV_CLASS_RE = re.compile(r"prov\d+")
+_PROV_HDR_CLASS_RE = re.compile(r"prov\d+Hdr")
+_PROV_TXT_CLASS_RE = re.compile(r"prov\d+Txt")
+_SCHED_HDR_CLASS_RE = re.compile(r"(sHdr|scHdr)")
+_NUMBER_RE = re.compile(r"^\d+[A-Z]?\.?$")  # Match "1." or "2A." etc.
+_HDR_PROV_RE = re.compile(r"pr(\d+[A-Z]?)-?")
+_HDR_SCHED_RE = re.compile(r"Sc(\d+)-")
+_NEWLINES_RE = re.compile(r"\n{3,}")
+_PAREN_RE = re.compile(r"\(\s*\n\s*([a-zA-Z0-9]+)\s*\n\s*\)")
+_AUTHORISING_ACT_RE = re.compile("Authorising Act", re.IGNORECASE)
+
+
+# --- HTML Helpers ---
+def _parse(html):
+    """
+    Parses SL page HTML with the Lexbor backend. An already-parsed tree is
+    returned as-is so callers holding one don't parse the page twice.
+    """
+    if isinstance(html, LexborHTMLParser):
+        return html
+    return LexborHTMLParser(html)
+
+
+def _get_text(node, separator=""):
+    """
+    Equivalent of BeautifulSoup's get_text(separator=..., strip=True).
+
+    Lexbor keeps whitespace-only text nodes as empty strings when stripping,
+    so drop them before joining to avoid stray blank lines.
+    """
+    if separator == "":
+        return node.text(deep=True, strip=True)
+    parts = node.text(deep=True, separator="\x00", strip=True).split("\x00")
+    return separator.join(part for part in parts if part)
+
+
+def _has_class(node, class_re) -> bool:
+    """True if any of the node's classes matches class_re (like BS4's class_=re)."""
+    # A valueless class attribute comes back as None
+    classes = (node.attributes.get("class") or "").split()
+    return any(class_re.search(cls) for cls in classes)
+
+
+def _find_by_class(node, selector: str, class_re):
+    """
+    First descendant of node matching the CSS selector with a class matching
+    class_re, like BS4's node.find([...], class_=re). Lexbor's css() includes
+    the node itself, which find() does not, so it is skipped.
+    """
+    for candidate in node.css(selector):
+        if candidate != node and _has_class(candidate, class_re):
+            return candidate
+    return None
+
+
 # --- Helper Function: Extract Sections from HTML Fragment ---
-# (No changes needed from previous version, already handles SL structure)
-def extract_sections_from_html(html_content: str, sl_path_for_logs: str) -> list:
-    """Parses HTML content from an SL page and extracts section data."""
+def extract_sections_from_html(html_content, sl_path_for_logs: str) -> list:
+    """
+    Parses HTML content from an SL page (raw bytes as returned by
+    response.content, str, or an already-parsed tree, which is modified in
+    place) and extracts section data. Prefer bytes: the parser reads the
+    page's declared charset itself, so requests never has to guess one.
+    """
     sections = []
     if not html_content:
         logging.warning(
@@ -364,31 +427,39 @@ def extract_sections_from_html(html_content: str, sl_path_for_logs: str) -> list
         return sections
 
     try:
-        soup = BeautifulSoup(html_content, "lxml")  # Use lxml for speed
+        tree = _parse(html_content)
 
         # Remove amendment notes first
-        for amendNote in soup.find_all(class_="amendNote"):
+        for amendNote in tree.css(".amendNote"):
             amendNote.decompose()
 
         # Find the main content container for SL pages
-        sections_container = soup.find("div", id="legisContent")
+        sections_container = tree.css_first("div#legisContent")
 
         if not sections_container:
             logging.warning(
                 f"[{sl_path_for_logs}] Could not find 'div#legisContent'. Trying body."
             )
-            sections_container = soup.find(
-                "div", class_="body-content"
-            )  # Broader fallback
+            sections_container = tree.css_first("div.body-content")  # Broader fallback
             if not sections_container:
                 logging.warning(
-                    f"[{sl_path_for_logs}] Could not find content container. Trying entire soup."
+                    f"[{sl_path_for_logs}] Could not find content container. Trying entire page."
                 )
-                sections_container = soup  # Last resort
-
-        # Find section divs (prov1 seems consistent) and schedules
-        section_divs = sections_container.find_all("div", class_=re.compile(r"prov\d+"))
-        schedule_divs = sections_container.find_all("div", class_="schedule")
+                sections_container = tree.root  # Last resort
+
+        # Find section divs (prov1 seems consistent) and schedules. The CSS
+        # substring match narrows candidates in C; the class regex then only
+        # runs on divs that mention "prov".
+        section_divs = [
+            div
+            for div in sections_container.css('div[class*="prov"]')
+            if div != sections_container and _has_class(div, _PROV_CLASS_RE)
+        ]
+        schedule_divs = [
+            div
+            for div in sections_container.css("div.schedule")
+            if div != sections_container
+        ]
 
         if not section_divs and not schedule_divs:
             logging.warning(
@@ -407,33 +478,35 @@ def extract_sections_from_html(html_content: str, sl_path_for_logs: str) -> list
             header_id = None
 
             # Adapt selectors based on element type
-            element_classes = element.get("class", [])
+            element_classes = (element.attributes.get("class") or "").split()
             is_prov = any("prov" in cls for cls in element_classes)
             is_schedule = "schedule" in element_classes
 
             if is_prov:
-                header_tag = element.find(
-                    ["td", "div"], class_=re.compile(r"prov\d+Hdr")
+                header_tag = _find_by_class(
+                    element, 'td[class*="Hdr"], div[class*="Hdr"]', _PROV_HDR_CLASS_RE
                 )
-                content_tag = element.find(
-                    ["td", "div"], class_=re.compile(r"prov\d+Txt")
+                content_tag = _find_by_class(
+                    element, 'td[class*="Txt"], div[class*="Txt"]', _PROV_TXT_CLASS_RE
                 )
                 if not content_tag:
                     content_tag = element  # Fallback if no specific Txt tag
                 if header_tag:
-                    title_text_only = header_tag.get_text(strip=True)
+                    title_text_only = _get_text(header_tag)
                 if header_tag:
-                    header_id = header_tag.get("id")
+                    header_id = header_tag.attributes.get("id")
 
             elif is_schedule:
-                header_tag = element.find(
-                    ["td", "div", "p"], class_=re.compile(r"(sHdr|scHdr)")
+                header_tag = _find_by_class(
+                    element,
+                    'td[class*="Hdr"], div[class*="Hdr"], p[class*="Hdr"]',
+                    _SCHED_HDR_CLASS_RE,
                 )
                 content_tag = element  # Use the whole schedule div
                 if header_tag:
-                    title_text_only = header_tag.get_text(strip=True)
+                    title_text_only = _get_text(header_tag)
                 if header_tag:
-                    header_id = header_tag.get("id")
+                    header_id = header_tag.attributes.get("id")
                 # Prepend "Schedule" to title if not already there
                 if header_tag and not title_text_only.lower().startswith("schedule"):
                     title_text_only = f"SCHEDULE {title_text_only}"
@@ -452,31 +525,30 @@ def extract_sections_from_html(html_content: str, sl_path_for_logs: str) -> list
             full_title = title_text_only.strip()
 
             # Try extracting number from <strong> tag inside content (common pattern)
-            number_tag = content_tag.find("strong")
+            number_tag = content_tag.css_first("strong")
             if number_tag:
-                potential_number = number_tag.get_text(strip=True)
-                if re.match(
-                    r"^\d+[A-Z]?\.?$", potential_number
-                ):  # Match "1." or "2A." etc.
+                potential_number = _get_text(number_tag)
+                if _NUMBER_RE.match(potential_number):
                     section_number_text = potential_number
                     # Clean title: remove number if present, then format
-                    clean_title = re.sub(
-                        r"^" + re.escape(potential_number) + r"\s*", "", full_title
-                    ).strip()
+                    clean_title = full_title
+                    if clean_title.startswith(potential_number):
+                        clean_title = clean_title[len(potential_number) :]
+                    clean_title = clean_title.strip()
                     full_title = (
                         f"Rule {section_number_text} {clean_title}".strip()
                     )  # Use "Rule" for SL? Or keep generic? Let's try Rule.
 
             # Fallback: Try extracting number from header ID (e.g., id="pr1-")
             if not section_number_text and header_id:
-                match_prov = re.match(r"pr(\d+[A-Z]?)-?", header_id)
+                match_prov = _HDR_PROV_RE.match(header_id)
                 if match_prov:
                     section_number_text = match_prov.group(1) + "."
                     full_title = (
                         f"Rule {section_number_text} {title_text_only}"  # Use Rule
                     )
                 else:
-                    match_sched = re.match(r"Sc(\d+)-", header_id)
+                    match_sched = _HDR_SCHED_RE.match(header_id)
                     if match_sched:
                         # Title extracted earlier for schedules should be okay
                         full_title = title_text_only  # Keep SCHEDULE X title
@@ -486,20 +558,17 @@ def extract_sections_from_html(html_content: str, sl_path_for_logs: str) -> list
                 section["section_title"] = "Untitled Section/Schedule"  # Fallback title
 
             # --- Content Extraction ---
-            section_content_raw = content_tag.get_text(separator="\n", strip=True)
-            processed_content = re.sub(
-                r"\n{3,}", r"\n\n", section_content_raw
+            section_content_raw = _get_text(content_tag, separator="\n")
+            processed_content = _NEWLINES_RE.sub(
+                "\n\n", section_content_raw
             )  # Clean excessive newlines
             # Remove leading number if captured and present at start of content
             if section_number_text:
-                escaped_num = re.escape(section_number_text)
-                processed_content = re.sub(
-                    r"^" + escaped_num + r"[\s\n]*", "", processed_content, count=1
-                ).strip()
+                if processed_content.startswith(section_number_text):
+                    processed_content = processed_content[len(section_number_text) :]
+                processed_content = processed_content.strip()
             # Specific cleanup for "( \n a \n )" pattern
-            processed_content = re.sub(
-                r"\(\s*\n\s*([a-zA-Z0-9]+)\s*\n\s*\)", r"(\1)", processed_content
-            )
+            processed_content = _PAREN_RE.sub(r"(\1)", processed_content)
 
             section["section_content"] = processed_content.strip()
 
@@ -510,9 +579,9 @@ def extract_sections_from_html(html_content: str, sl_path_for_logs: str) -> list
             section["cot_pairs"] = None
 
             # --- Additional Info ---
-            additional_info["source_element_class"] = element.get("class")
+            additional_info["source_element_class"] = element_classes
             additional_info["header_id"] = header_id
-            section["additional"] = json.dumps(additional_info)
+            section["additional"] = additional_info
 
             sections.append(section)
 
@@ -525,19 +594,106 @@ def extract_sections_from_html(html_content: str, sl_path_for_logs: str) -> list
     return sections
 
 
+def _section_sort_key(section):
+    """
+    Sort key ordering rules before schedules, each by number then letter
+    suffix. Read from the header id captured during extraction (e.g. "pr12A-",
+    "Sc3-") rather than parsed out of the title.
+    """
+    header_id = section["additional"].get("header_id") or ""
+    is_schedule = header_id.startswith("Sc")
+    if is_schedule or header_id.startswith("pr"):
+        label = header_id[2:].split("-", 1)[0]  # e.g. "12A"
+        digits = label.rstrip(string.ascii_letters)
+        if digits.isdigit():
+            alpha_val = sum(
+                (ord(char) - ord("A") + 1) * (100**i)
+                for i, char in enumerate(reversed(label[len(digits) :].upper()))
+            )
+            return (1 if is_schedule else 0, int(digits), alpha_val)
+    return (2, 0, section.get("section_title", ""))  # Fallback sort
+
+
+# --- Page Parsing for SL ---
+def parse_sl_page(
+    html_content: str | bytes, sl_path: str
+) -> tuple[str | None, str | None, list]:
+    """
+    Parses a fetched SL page into its title, authorising Act link and sections.
+
+    Pure (no network or database access), so it runs on the scraping
+    threads; Lexbor releases the GIL while it parses.
+
+    Args:
+        html_content: The raw page (bytes or str).
+        sl_path: The SL path, used for logging.
+
+    Returns:
+        Tuple of (act_name, parent_act_path, all_sections_data). act_name and
+        parent_act_path are None when the page does not contain them;
+        all_sections_data is sorted.
+    """
+    # Parse once; metadata and sections are both read from this tree
+    tree = _parse(html_content)
+
+    # Extract SL Title
+    title_tag = tree.css_first("td.slTitle")
+    if not title_tag:
+        title_div = tree.css_first("div.legis-title")
+        if title_div:
+            title_tag = title_div.css_first("span")  # Try span inside legis-title
+    act_name = _get_text(title_tag) if title_tag else None
+
+    # Find Parent Act Link
+    parent_act_link = next(
+        (
+            link
+            for link in tree.css("a[href]")
+            if _AUTHORISING_ACT_RE.search(link.text(deep=True))
+        ),
+        None,
+    )
+    parent_act_path = (
+        parent_act_link.attributes["href"] if parent_act_link else None
+    )
+
+    # Extract Sections (after metadata, since extraction strips amendment
+    # notes from the tree)
+    logging.info(f"[{sl_path}] Extracting sections from initial page content...")
+    all_sections_data = extract_sections_from_html(tree, sl_path)
+
+    if all_sections_data:
+        # Sort sections (optional but good practice)
+        try:
+            all_sections_data.sort(key=_section_sort_key)
+            logging.info(f"[{sl_path}] Sections sorted successfully.")
+            # logging.debug(f"First extracted section:\n{json.dumps(all_sections_data[0], indent=2)}")
+        except Exception as sort_e:
+            logging.warning(f"[{sl_path}] Could not sort sections: {sort_e}")
+
+    return act_name, parent_act_path, all_sections_data
+
+
 # --- Main Scraping Logic for SL ---
 def scrape_subsidiary_legislation(
-    sl_path: str, session: requests.Session
+    sl_path: str,
+    session: requests.Session,
+    validators: dict | None = None,
 ) -> tuple[dict | None, list | None]:
     """
     Scrapes a single Subsidiary Legislation page from Singapore Statutes Online.
 
     Args:
         sl_path: The path part of the URL (must start with "/SL/").
-        session: The requests Session object.
+        session: The requests Session object (see create_session; it supplies the
+            base headers).
+        validators: Optional stored "etag"/"last_modified" of the SL, sent as
+            If-None-Match/If-Modified-Since so an unchanged page isn't
+            downloaded or parsed again.
 
     Returns:
-        Tuple of (sl_data, all_sections_data) or (None, None) on failure.
+        Tuple of (sl_data, all_sections_data), (SL_NOT_MODIFIED, None) if the
+        page is unchanged, or (None, None) on failure.
     """
     if not sl_path or not sl_path.startswith("/SL/"):
         logging.error(
@@ -547,58 +703,55 @@ def scrape_subsidiary_legislation(
 
     sl_data = {}
     all_sections_data = []
-    target_url = urljoin(BASE_URL, sl_path)
+    target_url = f"{BASE_URL}{sl_path}"  # sl_path is validated to start with /SL/
 
     logging.info(f"--- Starting scrape for SL: {sl_path} ---")
     logging.info(f"Target URL: {target_url}")
 
     try:
         # 1. Initial Fetch
-        headers = base_headers.copy()
-        headers["referer"] = BASE_URL  # General referer for initial nav
+        headers = {"referer": BASE_URL}  # General referer for initial nav
+        if validators:
+            if validators.get("etag"):
+                headers["if-none-match"] = validators["etag"]
+            if validators.get("last_modified"):
+                headers["if-modified-since"] = validators["last_modified"]
+        _request_limiter.acquire()
         response_initial = session.get(
             target_url, headers=headers, timeout=20
         )  # Added timeout
         response_initial.raise_for_status()  # Check for HTTP errors
-        soup_initial = BeautifulSoup(response_initial.content, "lxml")
-        initial_html_content = response_initial.text  # Use this content directly
+        if response_initial.status_code == 304:
+            logging.info(f"[{sl_path}] Not modified since last scrape; skipping.")
+            return SL_NOT_MODIFIED, None
+
+        # 2. Parse title, parent link and sections
+        act_name, parent_act_path, all_sections_data = parse_sl_page(
+            response_initial.content, sl_path
+        )
 
-        # 2. Extract Metadata and Parent Info
+        # 3. Build Metadata and resolve Parent Info
         sl_data["country"] = "SINGAPORE"
         sl_data["source"] = "Singapore Statutes Online (sso.agc.gov.sg)"
-        sl_data["source_id"] = sl_path.strip("/").split("/")[-1]  # e.g., "AA2004-R5"
+        sl_data["source_id"] = _source_id(sl_path)  # e.g., "AA2004-R5"
         sl_data["parent_id"] = None  # Initialize
-
-        # Extract SL Title
-        title_tag = soup_initial.find("td", class_="slTitle")
-        if not title_tag:
-            title_div = soup_initial.find("div", class_="legis-title")
-            if title_div:
-                title_tag = title_div.find("span")  # Try span inside legis-title
-        sl_data["act_name"] = (
-            title_tag.get_text(strip=True)
-            if title_tag
-            else f"UNKNOWN SL ({sl_data['source_id']})"
-        )
+        sl_data["etag"] = response_initial.headers.get("ETag")
+        sl_data["last_modified"] = response_initial.headers.get("Last-Modified")
+        sl_data["act_name"] = act_name or f"UNKNOWN SL ({sl_data['source_id']})"
         sl_data["act_description"] = (
             ""  # SL usually doesn't have a separate long description field like Acts
         )
 
-        # Find Parent Act Link and ID
         # NOTE: Parent Act MUST exist in the database first for the foreign key constraint
-        parent_act_link = soup_initial.find(
-            "a", string=re.compile("Authorising Act", re.IGNORECASE), href=True
-        )
-        if parent_act_link:
-            parent_act_path = parent_act_link["href"]
+        if parent_act_path is not None:
             # Basic validation of parent path
             if parent_act_path and parent_act_path.startswith("/Act/"):
-                parent_source_id = parent_act_path.strip("/").split("/")[-1]
+                parent_source_id = _source_id(parent_act_path)
                 logging.info(
                     f"[{sl_path}] Found parent Act link: {parent_act_path} (Source ID: {parent_source_id})"
                 )
-                # Look up parent ID in the database
-                parent_act_id = get_act_id_by_source_id(parent_source_id, supabase)
+                # Look up parent ID in the database (cached for the batch)
+                parent_act_id = get_parent_act_id(parent_source_id)
                 if parent_act_id:
                     sl_data["parent_id"] = parent_act_id
                     logging.info(f"[{sl_path}] Found parent act_id: {parent_act_id}")
@@ -619,41 +772,13 @@ def scrape_subsidiary_legislation(
                 f"[{sl_path}] Could not find 'Authorising Act' link. 'parent_id' will be NULL."
             )
 
-        # 3. Extract Sections from the initial HTML
-        logging.info(f"[{sl_path}] Extracting sections from initial page content...")
-        all_sections_data = extract_sections_from_html(initial_html_content, sl_path)
-
-        logging.info(f"--- Extracted SL Data for {sl_path} ---")
-        logging.info(json.dumps(sl_data, indent=2))
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug(f"--- Extracted SL Data for {sl_path} ---")
+            logging.debug(json.dumps(sl_data, indent=2))
         logging.info(
             f"--- Total Sections Extracted for {sl_path}: {len(all_sections_data)} ---"
         )
 
-        if all_sections_data:
-            # Sort sections (optional but good practice)
-            def sort_key(section):
-                title = section.get("section_title", "")
-                match = re.search(
-                    r"(?:Rule|Section|SCHEDULE)\s*(\d+)([A-Z]*)", title, re.IGNORECASE
-                )
-                if match:
-                    num_part = int(match.group(1))
-                    alpha_part = match.group(2).upper()
-                    alpha_val = sum(
-                        (ord(char) - ord("A") + 1) * (100**i)
-                        for i, char in enumerate(reversed(alpha_part))
-                    )
-                    is_schedule = "schedule" in title.lower()
-                    return (1 if is_schedule else 0, num_part, alpha_val)
-                return (2, 0, title)  # Fallback sort
-
-            try:
-                all_sections_data.sort(key=sort_key)
-                logging.info(f"[{sl_path}] Sections sorted successfully.")
-                # logging.debug(f"First extracted section:\n{json.dumps(all_sections_data[0], indent=2)}")
-            except Exception as sort_e:
-                logging.warning(f"[{sl_path}] Could not sort sections: {sort_e}")
-
         return sl_data, all_sections_data
 
     except requests.exceptions.Timeout:
@@ -675,68 +800,112 @@ def scrape_subsidiary_legislation(
 
 
 # --- Batch Processing for SL ---
-def scrape_and_store_multiple_sls(sl_paths_to_scrape: list):
+def scrape_and_store_multiple_sls(
+    sl_paths_to_scrape: list, max_workers: int = MAX_SCRAPE_WORKERS
+):
     """
     Scrapes and stores multiple Subsidiary Legislations based on a list of paths.
 
+    Fetching and parsing run on a thread pool; storing in Supabase stays on
+    the calling thread so writes happen one SL at a time.
+
     Args:
         sl_paths_to_scrape: List of SL paths (e.g., ["/SL/AA2004-R5", "/SL/BCPA1999-R1"])
+        max_workers: Number of SLs to scrape concurrently
     """
-    results = {}
-    total_paths = len(sl_paths_to_scrape)
-    session = requests.Session()  # Use a session for connection pooling
+    # Repeated paths are scraped and stored once (order of first occurrence kept)
+    results = dict.fromkeys(sl_paths_to_scrape, False)
+    total_paths = len(results)
+    completed = 0
+    session = create_session()  # Pooled keep-alive connections shared by the workers
+    _parent_act_ids.clear()
+    # Stored ETag/Last-Modified per SL, for conditional GETs
+    validators = get_http_validators(
+        [_source_id(sl_path) for sl_path in results], supabase
+    )
 
     logging.info(f"\n=== Starting batch scraping of {total_paths} SL paths ===\n")
 
-    for index, sl_path in enumerate(sl_paths_to_scrape, 1):
-        logging.info(f"\n[{index}/{total_paths}] Processing SL path: {sl_path}")
-
-        try:
-            # 1. Scrape the SL
-            sl_data, all_sections_data = scrape_subsidiary_legislation(sl_path, session)
-
-            # 2. Store if data was retrieved
-            if (
-                sl_data and all_sections_data is not None
-            ):  # Check sections is not None (can be empty list)
-                sl_name_log = sl_data.get("act_name", f"Unknown ({sl_path})")
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        paths_iter = iter(list(results))
+        pending = {}
+
+        def submit_next():
+            sl_path = next(paths_iter, None)
+            if sl_path is not None:
+                future = executor.submit(
+                    scrape_subsidiary_legislation,
+                    sl_path,
+                    session,
+                    validators.get(_source_id(sl_path)),
+                )
+                pending[future] = sl_path
+
+        # Keep a bounded number of scraped SLs in flight so memory stays flat
+        # even when Supabase writes fall behind the scrapers.
+        for _ in range(max_workers * 2):
+            submit_next()
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                sl_path = pending.pop(future)
+                completed += 1
                 logging.info(
-                    f"Successfully scraped SL '{sl_name_log}' with {len(all_sections_data)} sections."
+                    f"\n[{completed}/{total_paths}] Processing SL path: {sl_path}"
                 )
-                logging.info("Storing/Updating SL in Supabase...")
-
-                success = store_in_supabase(sl_data, all_sections_data, supabase)
 
-                if success:
-                    logging.info(
-                        f"Successfully stored/updated SL '{sl_name_log}' in Supabase."
-                    )
-                    results[sl_path] = True
-                else:
+                try:
+                    # 1. Collect the scraped SL
+                    sl_data, all_sections_data = future.result()
+
+                    # 2. Store if data was retrieved
+                    if sl_data is SL_NOT_MODIFIED:
+                        logging.info(f"SL '{sl_path}' unchanged; nothing to store.")
+                        results[sl_path] = True
+                    elif (
+                        sl_data and all_sections_data is not None
+                    ):  # Check sections is not None (can be empty list)
+                        sl_name_log = sl_data.get("act_name", f"Unknown ({sl_path})")
+                        logging.info(
+                            f"Successfully scraped SL '{sl_name_log}' with {len(all_sections_data)} sections."
+                        )
+                        logging.info("Storing/Updating SL in Supabase...")
+
+                        success = store_in_supabase(
+                            sl_data, all_sections_data, supabase
+                        )
+
+                        if success:
+                            logging.info(
+                                f"Successfully stored/updated SL '{sl_name_log}' in Supabase."
+                            )
+                            results[sl_path] = True
+                        else:
+                            logging.error(
+                                f"Failed to store/update SL '{sl_name_log}' in Supabase."
+                            )
+                            results[sl_path] = False
+                    elif sl_data and all_sections_data is None:
+                        logging.error(
+                            f"Scraped metadata for SL '{sl_path}' but failed to extract sections."
+                        )
+                        results[sl_path] = False
+                    else:
+                        logging.error(f"Failed to scrape SL path: {sl_path}")
+                        results[sl_path] = False
+
+                except Exception as e:
                     logging.error(
-                        f"Failed to store/update SL '{sl_name_log}' in Supabase."
+                        f"Critical error processing SL path {sl_path}: {e}",
+                        exc_info=True,
                     )
                     results[sl_path] = False
-            elif sl_data and all_sections_data is None:
-                logging.error(
-                    f"Scraped metadata for SL '{sl_path}' but failed to extract sections."
-                )
-                results[sl_path] = False
-            else:
-                logging.error(f"Failed to scrape SL path: {sl_path}")
-                results[sl_path] = False
 
-        except Exception as e:
-            logging.error(
-                f"Critical error processing SL path {sl_path}: {e}", exc_info=True
-            )
-            results[sl_path] = False
-
-        # Optional delay between requests to be polite
-        time.sleep(0.5)  # Adjust delay as needed (e.g., 0.5 to 2 seconds)
+                # Add a separator for clarity
+                logging.info(f"\n{'-'*60}\n")
 
-        # Add a separator for clarity
-        logging.info(f"\n{'-'*60}\n")
+                submit_next()
 
     # Summary Report
     successful = sum(1 for success in results.values() if success)
@@ -754,92 +923,116 @@ def scrape_and_store_multiple_sls(sl_paths_to_scrape: list):
 
 
 # --- Fetch All SL Paths ---
+SL_BROWSE_PREFETCH_PAGES = 4  # Browse pages requested ahead of the one being processed
+
+
+def _sl_browse_url(index: int, page_size: int) -> str:
+    # Note: The index in the URL seems to be page number (0-based)
+    return f"https://sso.agc.gov.sg/Browse/SL/Current/All/{index}?PageSize={page_size}&SortBy=Number&SortOrder=ASC"
+
+
+def _fetch_sl_browse_links(session: requests.Session, url: str) -> list:
+    """Fetches one SL browse page and returns the hrefs of its links to /SL/ paths."""
+    logging.info(f"Fetching SL browse page: {url}")
+    headers = {
+        "referer": "https://sso.agc.gov.sg/Browse/SL/Current/All"  # Appropriate referer
+    }
+    _request_limiter.acquire()
+    response = session.get(url, headers=headers, timeout=30)
+    response.raise_for_status()
+    tree = _parse(response.content)
+    # Find links specifically starting with /SL/ within the results area
+    links = tree.css('div.browse-list-row a[href^="/SL/"]')  # Target results area
+    if not links:
+        logging.warning(
+            f"Could not find /SL/ links in 'div.browse-list-row' on {url}. Trying whole page."
+        )
+        links = tree.css('a[href^="/SL/"]')
+    return [link.attributes["href"] for link in links]
+
+
 def get_all_sl_paths(session: requests.Session) -> list:
-    """Gets all Subsidiary Legislation paths from the browse page."""
-    index = 0
-    sl_paths = set()
+    """
+    Gets all Subsidiary Legislation paths from the browse page. session should
+    come from create_session, which supplies the base headers.
+
+    Browse pages are numbered, so the next SL_BROWSE_PREFETCH_PAGES pages are
+    fetched concurrently while the current one is processed. Pages are still
+    processed in order and the crawl stops at the first short or empty page;
+    prefetches past it are discarded.
+
+    Paths are returned in the order the site lists them (SortBy=Number,
+    ascending), without re-sorting.
+    """
+    sl_paths = {}  # Insertion-ordered set of paths
     page_size = 500  # Match the PageSize parameter
+    page_indexes = count()
+    prefetched = deque()
     logging.info("Fetching all Subsidiary Legislation (SL) paths...")
-    while True:
-        # Note: The index in the URL seems to be page number (0-based)
-        url = f"https://sso.agc.gov.sg/Browse/SL/Current/All/{index}?PageSize={page_size}&SortBy=Number&SortOrder=ASC"
-        logging.info(f"Fetching SL browse page: {url}")
-        try:
-            headers = base_headers.copy()
-            headers["referer"] = (
-                "https://sso.agc.gov.sg/Browse/SL/Current/All"  # Appropriate referer
-            )
-            response = session.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, "lxml")
-            # Find links specifically starting with /SL/ within the results area
-            browse_results = soup.find(
-                "div", class_="browse-list-row"
-            )  # Target results area
-            links_found = []
-            if browse_results:
-                links_found = browse_results.find_all(
-                    "a", href=lambda href: href and href.startswith("/SL/")
-                )
-            else:
-                logging.warning(
-                    f"Could not find 'div.browseResults' on page {index}. Trying whole page."
-                )
-                links_found = soup.find_all(
-                    "a", href=lambda href: href and href.startswith("/SL/")
-                )
 
-            if not links_found:
-                logging.info(
-                    f"No more '/SL/' links found on page index {index}. Stopping."
-                )
-                break
+    with ThreadPoolExecutor(max_workers=SL_BROWSE_PREFETCH_PAGES) as executor:
 
-            count_on_page = 0
-            for link in links_found:
-                href = link["href"]
-                base_url_path = href.split("?")[0]  # Remove query params
-                if base_url_path not in sl_paths:
-                    sl_paths.add(base_url_path)
-                    count_on_page += 1
+        def submit_next():
+            index = next(page_indexes)
+            url = _sl_browse_url(index, page_size)
+            future = executor.submit(_fetch_sl_browse_links, session, url)
+            prefetched.append((index, url, future))
 
-            logging.info(
-                f"Found {count_on_page} new SL paths on index {index}. Total unique paths: {len(sl_paths)}"
-            )
+        for _ in range(SL_BROWSE_PREFETCH_PAGES):
+            submit_next()
+
+        while True:
+            index, url, future = prefetched.popleft()
+            submit_next()
+            try:
+                links_found = future.result()
+
+                if not links_found:
+                    logging.info(
+                        f"No more '/SL/' links found on page index {index}. Stopping."
+                    )
+                    break
+
+                page_paths = dict.fromkeys(
+                    href.split("?")[0]  # Remove query params
+                    for href in links_found
+                )
+                count_on_page = len(page_paths.keys() - sl_paths.keys())
+                sl_paths.update(page_paths)
 
-            # Check if this was the last page
-            print(len(count_on_page))
-            print(page_size)
-            print(len(count_on_page) < page_size)
-            if len(count_on_page) < page_size:
                 logging.info(
-                    f"Found {len(links_found)} links (less than PageSize={page_size}), assuming end of list."
+                    f"Found {count_on_page} new SL paths on index {index}. Total unique paths: {len(sl_paths)}"
                 )
-                break
 
-            index += 1  # Move to the next page index
+                # Check if this was the last page
+                if len(links_found) < page_size:
+                    logging.info(
+                        f"Found {len(links_found)} links (less than PageSize={page_size}), assuming end of list."
+                    )
+                    break
 
-        except requests.exceptions.Timeout:
-            logging.error(
-                f"Timeout fetching SL browse page {url}. Stopping path collection."
-            )
-            break
-        except requests.exceptions.RequestException as e:
-            logging.error(
-                f"Failed to fetch SL browse page {url}: {e}. Stopping path collection."
-            )
-            break
-        except Exception as e:
-            logging.error(
-                f"Error parsing SL browse page {url}: {e}. Stopping path collection."
-            )
-            break
+            except requests.exceptions.Timeout:
+                logging.error(
+                    f"Timeout fetching SL browse page {url}. Stopping path collection."
+                )
+                break
+            except requests.exceptions.RequestException as e:
+                logging.error(
+                    f"Failed to fetch SL browse page {url}: {e}. Stopping path collection."
+                )
+                break
+            except Exception as e:
+                logging.error(
+                    f"Error parsing SL browse page {url}: {e}. Stopping path collection."
+                )
+                break
 
-        # Optional delay between browse page requests
-        time.sleep(1)
+        # Don't start prefetches for pages past the end
+        for _, _, future in prefetched:
+            future.cancel()
 
     logging.info(f"Finished fetching SL paths. Total unique found: {len(sl_paths)}")
-    return sorted(list(sl_paths))
+    return list(sl_paths)
 
 
 # --- Main Execution ---
@@ -849,7 +1042,8 @@ if __name__ == "__main__":
     # IMPORTANT PRE-REQUISITE: Ensure main Acts are already scraped and present in the database
     # so that parent_id foreign key lookups can succeed.
 
-    req_session = requests.Session()
+    # Pooled, retrying session with the base headers (see create_session)
+    req_session = create_session()
 
     # Fetch all SL paths
     all_sl_paths_to_scrape = get_all_sl_paths(req_session)
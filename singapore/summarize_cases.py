@@ -1,6 +1,7 @@
+import hashlib
 import traceback
 from dotenv import load_dotenv
-from supabase import create_client
+from supabase import AsyncClient, acreate_client
 import os
 import asyncio
 import time
@@ -10,7 +11,23 @@ import sys
 
 load_dotenv()
 
-supabase = create_client(os.getenv("SUPABASE_URL"), os.getenv("SUPABASE_KEY"))
+_supabase: AsyncClient | None = None
+
+async def get_supabase() -> AsyncClient:
+    """
+    Async Supabase client, created on first use rather than at import time.
+    Queries are awaited, so database calls don't block the event loop while
+    other cases are being summarized.
+    """
+    global _supabase
+    if _supabase is None:
+        _supabase = await acreate_client(os.getenv("SUPABASE_URL"), os.getenv("SUPABASE_KEY"))
+    return _supabase
+
+SUMMARY_WORKERS = 5  # Concurrent LLM calls
+SAVE_BATCH_SIZE = 5  # Summaries written per database call
+CLAIM_BATCH_SIZE = 100  # Cases claimed per database call
+CLAIM_TIMEOUT_MINUTES = 60  # Claims older than this are taken to be abandoned
 
 
 sys.path.append('/home/azureuser')
@@ -27,74 +44,211 @@ async def summarize(case_text: str) -> str|None:
         print(f"Error in summarize function: {str(e)}")
         return None
 
-async def process_case(case):
+def content_hash(case_text: str) -> str:
+    """Key of a case's text in summary_cache (migrations/010_summary_cache.sql)."""
+    return hashlib.sha256(case_text.encode()).hexdigest()
+
+async def fetch_cached_summaries(hashes):
+    """Look up summaries for the given text hashes in one query; returns {hash: summary}."""
+    if not hashes:
+        return {}
+    try:
+        supabase = await get_supabase()
+        response = await supabase.table("summary_cache")\
+            .select("hash, summary")\
+            .in_("hash", list(hashes))\
+            .execute()
+        return {row["hash"]: row["summary"] for row in response.data}
+    except Exception as e:
+        print(f"Error reading summary cache: {str(e)}")
+        return {}
+
+async def process_case(case, cached_summaries):
+    """
+    Summarize one case; returns (case_id, summary, text_hash), or None if
+    skipped. text_hash is None when the summary was reused from cached_summaries.
+
+    While a summary is being generated its cached_summaries entry is a future,
+    so workers given a case with the same text wait for it instead of making
+    a second LLM call.
+    """
     try:
         case_id = case["id"]
         case_content = case["case_text"]
         if case_content is None or case_content.strip() == "":
             print(f"Skipping case {case_id} because it has no content")
-            return
-        
-        # Get summary
-        start_time = time.time()
-        print(f"Summarizing case {case_id}, court: {case['standard_court_name']}")
-        summary = await summarize(case_content)
-        elapsed = time.time() - start_time
+            return None
+
+        # Reuse the summary of a case with identical text
+        text_hash = case["content_hash"]
+        cached_summary = cached_summaries.get(text_hash)
+        if isinstance(cached_summary, asyncio.Future):
+            print(f"Waiting for summary of identical text for case {case_id}")
+            cached_summary = await cached_summary
+            if cached_summary is None:
+                print(f"Skipping case {case_id} because its identical case got no summary")
+                return None
+        if cached_summary is not None:
+            print(f"Reusing cached summary for case {case_id}")
+            return case_id, cached_summary, None
+
+        in_flight = asyncio.get_running_loop().create_future()
+        cached_summaries[text_hash] = in_flight
+        summary = None
+        try:
+            # Get summary
+            start_time = time.time()
+            print(f"Summarizing case {case_id}, court: {case['standard_court_name']}")
+            summary = await summarize(case_content)
+            elapsed = time.time() - start_time
+        finally:
+            in_flight.set_result(summary)
+            if cached_summaries.get(text_hash) is in_flight:
+                if summary is None:
+                    del cached_summaries[text_hash]
+                else:
+                    cached_summaries[text_hash] = summary
 
         if summary is None:
             print(f"Skipping case {case_id} because it has no summary")
-            return
-        
-        # Update the database
-        supabase.table("caselaw_singapore").update({"summary": summary}).eq("id", case_id).execute()
-        
-        print(f"Updated summary for case {case_id} (API call: {elapsed:.2f}s)")
+            return None
+
+        print(f"Summarized case {case_id} (API call: {elapsed:.2f}s)")
+        return case_id, summary, text_hash
     except Exception as e:
         traceback.print_exc()
         print(f"Error processing case {case['id']}: {str(e)}")
+        return None
 
-async def process_batch(batch):
-    tasks = [process_case(case) for case in batch]
-    await asyncio.gather(*tasks)
-    
-async def process_cases():
-    # Fetch cases without summaries
-    result = supabase.table("caselaw_singapore")\
-        .select("id", "case_text, standard_court_name")\
-        .is_("summary", None)\
-        .neq("case_text", "")\
-        .not_.is_("standard_court_name", None)\
-        .limit(100)\
-        .execute()
-
-    cases = result.data
-    print(f"Processing {len(cases)} cases")
-    
-    if not cases:
-        return False  # No more cases to process
-
-    # Process cases in batches of 10
-    batch_size = 5
-    for i in range(0, len(cases), batch_size):
-        batch = cases[i:i+batch_size]
-        print(f"Processing batch {i//batch_size + 1}/{(len(cases)-1)//batch_size + 1} with {len(batch)} cases")
-        await process_batch(batch)
-    
-    return True  # More cases might be available
+async def save_summaries(results):
+    """
+    Save process_case results in one call, and add newly generated summaries
+    to summary_cache in another; returns the ids saved.
+    """
+    # (migrations/007_update_caselaw_summaries.sql)
+    try:
+        supabase = await get_supabase()
+        await supabase.rpc(
+            "update_caselaw_summaries",
+            {"rows": [{"id": case_id, "summary": summary} for case_id, summary, _ in results]},
+        ).execute()
+        print(f"Updated summaries for cases {[case_id for case_id, _, _ in results]}")
+    except Exception as e:
+        traceback.print_exc()
+        print(f"Error saving summaries for batch: {str(e)}")
+        return set()
 
-async def main():
-    print("Starting summarization")
+    new_entries = {
+        text_hash: summary for _, summary, text_hash in results if text_hash is not None
+    }
+    if new_entries:
+        try:
+            await supabase.table("summary_cache").upsert(
+                [{"hash": text_hash, "summary": summary} for text_hash, summary in new_entries.items()],
+                on_conflict="hash",
+                ignore_duplicates=True,
+                returning="minimal",
+            ).execute()
+        except Exception as e:
+            print(f"Error writing summary cache: {str(e)}")
+
+    return {case_id for case_id, _, _ in results}
+
+async def release_claims(case_ids):
+    """
+    Clear the claim on cases that didn't get a summary so a later run retries
+    them without waiting for CLAIM_TIMEOUT_MINUTES.
+    """
+    if not case_ids:
+        return
+    try:
+        supabase = await get_supabase()
+        await supabase.table("caselaw_singapore")\
+            .update({"summary_claimed_at": None}, returning="minimal")\
+            .in_("id", list(case_ids))\
+            .is_("summary", None)\
+            .execute()
+        print(f"Released {len(case_ids)} unsummarized cases")
+    except Exception as e:
+        traceback.print_exc()
+        print(f"Error releasing claimed cases {sorted(case_ids)}: {str(e)}")
+
+async def summarize_worker(queue, pending, unsaved_ids, cached_summaries):
+    """Summarize cases from the queue until a None sentinel, saving every SAVE_BATCH_SIZE."""
+    while (case := await queue.get()) is not None:
+        result = await process_case(case, cached_summaries)
+        if result:
+            pending.append(result)
+            if len(pending) >= SAVE_BATCH_SIZE:
+                batch = pending.copy()
+                pending.clear()
+                unsaved_ids -= await save_summaries(batch)
     
+async def process_cases(unsaved_ids):
+    # Each worker starts its next case as soon as it finishes one, instead of
+    # the whole batch waiting on its slowest LLM call
+    queue = asyncio.Queue(maxsize=2 * SUMMARY_WORKERS)
+    pending = []  # Summaries not yet saved, shared by the workers
+    # text hash -> summary (or a future while one is being generated), filled
+    # from summary_cache and new summaries
+    cached_summaries = {}
+    workers = [
+        asyncio.create_task(
+            summarize_worker(queue, pending, unsaved_ids, cached_summaries)
+        )
+        for _ in range(SUMMARY_WORKERS)
+    ]
+
     try:
         while True:
-            has_more = await process_cases()
-            
-            if not has_more:
+            # Claim cases without summaries; concurrent runs get disjoint cases
+            # (migrations/011_caselaw_singapore_summary_claims.sql)
+            supabase = await get_supabase()
+            result = await supabase.rpc(
+                "claim_cases_to_summarize",
+                {
+                    "batch_size": CLAIM_BATCH_SIZE,
+                    "claim_timeout_minutes": CLAIM_TIMEOUT_MINUTES,
+                },
+            ).execute()
+
+            cases = result.data
+            print(f"Processing {len(cases)} cases")
+
+            if not cases:
                 print("No more cases to process")
                 break
+            unsaved_ids.update(case["id"] for case in cases)
+
+            # One cache lookup for the whole claim rather than one per case
+            for case in cases:
+                case["content_hash"] = content_hash(case["case_text"] or "")
+            cached_summaries.update(await fetch_cached_summaries(
+                {case["content_hash"] for case in cases} - cached_summaries.keys()
+            ))
+
+            for case in cases:
+                await queue.put(case)
+    finally:
+        for _ in workers:
+            await queue.put(None)
+        await asyncio.gather(*workers)
+        if pending:
+            unsaved_ids -= await save_summaries(pending)
+
+async def main():
+    print("Starting summarization")
+    # Claimed cases without a saved summary; released at the end rather than
+    # straight away so this run doesn't claim them again
+    unsaved_ids = set()
+    
+    try:
+        await process_cases(unsaved_ids)
     except Exception as e:
         traceback.print_exc()
         print(f"Error in main processing loop: {str(e)}")
+    finally:
+        await release_claims(unsaved_ids)
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
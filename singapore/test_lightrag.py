@@ -1,6 +1,7 @@
 import asyncio
 import json
 import os
+from functools import lru_cache
 
 import numpy as np
 from dotenv import load_dotenv
@@ -8,12 +9,18 @@ from lightrag import LightRAG, QueryParam
 from lightrag.kg.shared_storage import initialize_pipeline_status
 from lightrag.llm.openai import openai_complete_if_cache, openai_embed
 from lightrag.utils import EmbeddingFunc
-from supabase import create_client
+from supabase import acreate_client
 
 load_dotenv()
 
 
-WORKING_DIR = "./singapore_acts"
+# Set to a sentence-transformers model (e.g. "sentence-transformers/all-MiniLM-L6-v2")
+# to compute embeddings locally instead of calling the embedding API. Local
+# vectors aren't comparable with the API ones already in ./singapore_acts, so
+# they get their own working dir, indexed with FAISS.
+LOCAL_EMBEDDING_MODEL = os.getenv("LOCAL_EMBEDDING_MODEL")
+
+WORKING_DIR = "./singapore_acts_local" if LOCAL_EMBEDDING_MODEL else "./singapore_acts"
 
 if not os.path.exists(WORKING_DIR):
     os.mkdir(WORKING_DIR)
@@ -34,7 +41,23 @@ async def llm_model_func(
     )
 
 
+@lru_cache(maxsize=1)
+def get_local_encoder():
+    from sentence_transformers import SentenceTransformer
+
+    return SentenceTransformer(LOCAL_EMBEDDING_MODEL)
+
+
+def encode_locally(texts: list[str]) -> np.ndarray:
+    return get_local_encoder().encode(
+        texts, batch_size=64, convert_to_numpy=True, normalize_embeddings=True
+    )
+
+
 async def embedding_func(texts: list[str]) -> np.ndarray:
+    if LOCAL_EMBEDDING_MODEL:
+        # Model loading and inference are blocking; keep them off the event loop
+        return await asyncio.to_thread(encode_locally, texts)
     return await openai_embed(
         texts,
         model="cohere-embed-v3",
@@ -69,6 +92,9 @@ async def initialize_rag():
 
     rag = LightRAG(
         working_dir=WORKING_DIR,
+        vector_storage=(
+            "FaissVectorDBStorage" if LOCAL_EMBEDDING_MODEL else "NanoVectorDBStorage"
+        ),
         llm_model_func=llm_model_func,
         embedding_func=EmbeddingFunc(
             embedding_dim=embedding_dimension,
@@ -89,23 +115,27 @@ async def main():
     # with open('sections.json', 'r') as file:
     #     sections = json.load(file)
 
-    supabase = create_client(
+    supabase = await acreate_client(
         os.getenv("SUPABASE_URL"),
         os.getenv("SUPABASE_KEY"),
     )
 
-    # sections = supabase.table("sections").select("*").eq("act_id",3547).execute().data
+    # sections = (await supabase.table("sections").select("*").eq("act_id",3547).execute()).data
     # print(len(sections))
 
-    # for section in sections:
-    #     act_name = 'ACCOUNTANTS ACT 2004'
-    #     # subsidiary_legislation = 'Subsidiary Legislation Name: ACCOUNTANTS\n(PRESCRIBED DOCUMENTS AND\nINFORMATION) RULES 2024'
-    #     text = f"""
+    # act_name = 'ACCOUNTANTS ACT 2004'
+    # # subsidiary_legislation = 'Subsidiary Legislation Name: ACCOUNTANTS\n(PRESCRIBED DOCUMENTS AND\nINFORMATION) RULES 2024'
+    # texts = [
+    #     f"""
     #     Act Name: {act_name}
     #     Section Title: {section['section_title']}
     #     Section Content: {section['section_content']}
     #     """
-    #     await rag.ainsert(text)
+    #     for section in sections
+    # ]
+    # # One ainsert for all sections: LightRAG chunks and embeds them in
+    # # batches instead of one embedding request per section
+    # await rag.ainsert(texts)
 
     query = "A client needs a certified copy of their accounting firm's approval document but accidentally included their personal mobile number in the filing."
     result = await rag.aquery(
@@ -3,8 +3,14 @@ Utility module for tracking cron job execution in Supabase.
 """
 
 import os
-import time
-from typing import Any, Dict, Optional, Tuple, Union
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, Optional, Tuple, Union
+
+
+def _utc_now() -> str:
+    """Current time as an ISO 8601 string with an explicit UTC offset."""
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
 
 
 def start_job(supabase_client, job_name: str) -> Tuple[Optional[str], bool]:
@@ -19,7 +25,7 @@ def start_job(supabase_client, job_name: str) -> Tuple[Optional[str], bool]:
         Tuple of (job_run_id, success)
     """
     try:
-        start_time = time.strftime("%Y-%m-%d %H:%M:%S%z")
+        start_time = _utc_now()
         response = (
             supabase_client.table("cron_job_runs")
             .insert(
@@ -63,20 +69,18 @@ def complete_job(supabase_client, job_run_id: str, metrics: Dict[str, Any]) -> b
         return False
 
     try:
-        update_data = {
-            "end_time": time.strftime("%Y-%m-%d %H:%M:%S%z"),
-            "status": "completed",
-            **metrics,
-        }
+        update_data = {"end_time": _utc_now(), "status": "completed"}
+        update_data.update(metrics)
 
+        # Only the number of updated rows comes back, not the row itself
         response = (
             supabase_client.table("cron_job_runs")
-            .update(update_data)
+            .update(update_data, returning="minimal", count="exact")
             .eq("id", job_run_id)
             .execute()
         )
 
-        return bool(response.data)
+        return bool(response.count)
     except Exception as e:
         print(f"Error completing cron job: {e}")
         return False
@@ -103,20 +107,69 @@ def fail_job(
 
     try:
         update_data = {
-            "end_time": time.strftime("%Y-%m-%d %H:%M:%S%z"),
+            "end_time": _utc_now(),
             "status": "failed",
             "error_message": error_message,
-            **metrics,
         }
+        update_data.update(metrics)
 
+        # Only the number of updated rows comes back, not the row itself
         response = (
             supabase_client.table("cron_job_runs")
-            .update(update_data)
+            .update(update_data, returning="minimal", count="exact")
             .eq("id", job_run_id)
             .execute()
         )
 
-        return bool(response.data)
+        return bool(response.count)
     except Exception as e:
         print(f"Error marking cron job as failed: {e}")
         return False
+
+
+@contextmanager
+def track_job(supabase_client, job_name: str) -> Iterator[Dict[str, Any]]:
+    """
+    Track a short, synchronous cron job with a single insert.
+
+    Unlike start_job followed by complete_job/fail_job, nothing is written
+    while the job runs: one cron_job_runs row with both timestamps is
+    inserted when the block exits, saving a round-trip. Prefer start_job for
+    long jobs that should show as "started" while they run.
+
+    Args:
+        supabase_client: Initialized Supabase client
+        job_name: Name of the job (e.g., "singapore_caselaw_scraper")
+
+    Yields:
+        Dictionary of metrics for the job to fill in (e.g., {"new_cases_found": 10})
+
+    Exceptions raised in the block mark the run as failed and are re-raised.
+    A run stopped by KeyboardInterrupt or SystemExit is not recorded.
+
+    Example:
+        with track_job(supabase, "singapore_caselaw_scraper") as metrics:
+            metrics["pages_processed"] = 5
+    """
+    metrics = {"new_cases_found": 0, "pages_processed": 0}
+    run = {"job_name": job_name, "start_time": _utc_now(), "status": "completed"}
+
+    def record_run():
+        run["end_time"] = _utc_now()
+        run.update(metrics)
+        try:
+            supabase_client.table("cron_job_runs").insert(
+                run, returning="minimal"
+            ).execute()
+            print(f"Cron job '{job_name}' recorded as {run['status']}.")
+        except Exception as e:
+            print(f"Error recording cron job run: {e}")
+
+    try:
+        yield metrics
+    except Exception as e:
+        run["status"] = "failed"
+        run["error_message"] = str(e)
+        record_run()
+        raise
+    record_run()
@@ -0,0 +1,37 @@
+"""
+Utility module providing a thread-safe token-bucket rate limiter.
+"""
+
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Token bucket shared between threads.
+
+    Allows bursts of up to burst calls, then rate calls per second on
+    average. acquire() blocks until the caller's token is available; waiting
+    callers are served in the order they arrived.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.updated) * self.rate
+            )
+            self.updated = now
+            # Reserve a token now (possibly going into debt) and sleep outside
+            # the lock until it has been paid back
+            self.tokens -= 1
+            delay = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if delay:
+            time.sleep(delay)